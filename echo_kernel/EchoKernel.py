@@ -34,7 +34,6 @@ from echo_kernel.IEchoTool import IEchoTool
 from echo_kernel.EchoTool import EchoTool
 from echo_kernel.IStorageProvider import IStorageProvider
 import asyncio
-import inspect
 import functools
 from functools import partial
 
@@ -46,6 +45,9 @@ except ImportError:
 
 T = TypeVar('T')
 
+# Provider interfaces the kernel indexes registered providers by
+_PROVIDER_INTERFACES = (ITextProvider, IEmbeddingProvider, ITextMemory, IStorageProvider)
+
 class EchoKernel:
     """
     The central hub for managing AI providers, tools, and services.
@@ -61,18 +63,22 @@ class EchoKernel:
     
     def __init__(self, text_provider: Optional[ITextProvider] = None, embedding_provider: Optional[IEmbeddingProvider] = None, storage_provider: Optional[IStorageProvider] = None, tools: Optional[List[EchoTool]] = None, agent_logging_enabled: bool = AGENT_LOGGING_ENABLED):
         """Initialize the EchoKernel."""
-        self._text_providers: List[ITextProvider] = []
-        self._embedding_providers: List[IEmbeddingProvider] = []
-        self._memory_providers: List[ITextMemory] = []
-        self._storage_providers: List[IStorageProvider] = []
+        # Providers indexed by the interfaces they implement; the per-type
+        # lists below are aliases into this index.
+        self._by_type: Dict[type, List[Any]] = {interface: [] for interface in _PROVIDER_INTERFACES}
+        self._text_providers: List[ITextProvider] = self._by_type[ITextProvider]
+        self._embedding_providers: List[IEmbeddingProvider] = self._by_type[IEmbeddingProvider]
+        self._memory_providers: List[ITextMemory] = self._by_type[ITextMemory]
+        self._storage_providers: List[IStorageProvider] = self._by_type[IStorageProvider]
+        # Every registered provider keyed by id, for O(1) duplicate checks
+        # that don't go through the providers' __eq__. Holding the provider
+        # keeps its id from being reused by another object.
+        self._registered: Dict[int, Any] = {}
         self._tools: dict[str, EchoTool] = {}
         self._agent_logging_enabled = agent_logging_enabled
-        if text_provider:
-            self._text_providers.append(text_provider)
-        if embedding_provider:
-            self._embedding_providers.append(embedding_provider)
-        if storage_provider:
-            self._storage_providers.append(storage_provider)
+        for provider, declared in ((text_provider, ITextProvider), (embedding_provider, IEmbeddingProvider), (storage_provider, IStorageProvider)):
+            if provider:
+                self._index_provider(provider, declared)
         if tools:
             for tool in tools:
                 self.register_tool(tool)
@@ -125,15 +131,22 @@ class EchoKernel:
             ```
         """
         # Prevent duplicate registrations
-        if provider not in self._text_providers and provider not in self._embedding_providers and provider not in self._memory_providers and provider not in self._storage_providers:
-            if isinstance(provider, ITextProvider):
-                self._text_providers.append(provider)
-            elif isinstance(provider, IEmbeddingProvider):
-                self._embedding_providers.append(provider)
-            elif isinstance(provider, ITextMemory):
-                self._memory_providers.append(provider)
-            elif isinstance(provider, IStorageProvider):
-                self._storage_providers.append(provider)
+        if id(provider) in self._registered:
+            return
+
+        self._index_provider(provider)
+
+    def _index_provider(self, provider: Any, declared: Optional[type] = None) -> None:
+        """
+        Index a provider under every interface it implements, plus ``declared``,
+        the interface it was passed to the constructor as.
+        """
+        for interface in _PROVIDER_INTERFACES:
+            if interface is declared or isinstance(provider, interface):
+                bucket = self._by_type[interface]
+                if not any(p is provider for p in bucket):
+                    bucket.append(provider)
+                self._registered[id(provider)] = provider
 
     def register_tool(self, tool: Union[EchoTool, Callable]):
         """Register a tool with the kernel. If a tool with the same name already exists, it will be updated."""
@@ -148,7 +161,7 @@ class EchoKernel:
                     name=metadata.name,
                     func=tool,
                     description=metadata.description,
-                    parameters=metadata.parameters
+                    parameters=metadata.to_dict()["parameters"]
                 )
                 self._tools[echo_tool.name] = echo_tool
             else:
@@ -187,7 +200,11 @@ class EchoKernel:
                 await memory_service.add_text("Important info", {"source": "user"})
             ```
         """
-        for provider in self._text_providers + self._embedding_providers + self._memory_providers + self._storage_providers:
+        if service_type in self._by_type:
+            providers = self._by_type[service_type]
+            return cast(T, providers[0]) if providers else None
+
+        for provider in self._all_providers():
             if isinstance(provider, service_type):
                 return cast(T, provider)
         return None
@@ -202,14 +219,26 @@ class EchoKernel:
         Returns:
             List of providers of the specified type.
         """
-        return [cast(T, p) for p in self._text_providers + self._embedding_providers + self._memory_providers + self._storage_providers if isinstance(p, provider_type)]
+        if provider_type in self._by_type:
+            return list(self._by_type[provider_type])
+        return [cast(T, p) for p in self._all_providers() if isinstance(p, provider_type)]
+
+    def _all_providers(self) -> List[Any]:
+        """Get every registered provider once, in interface order."""
+        seen = set()
+        providers = []
+        for bucket in self._by_type.values():
+            for provider in bucket:
+                if id(provider) not in seen:
+                    seen.add(id(provider))
+                    providers.append(provider)
+        return providers
 
     def clear_providers(self) -> None:
         """Clear all registered providers."""
-        self._text_providers.clear()
-        self._embedding_providers.clear()
-        self._memory_providers.clear()
-        self._storage_providers.clear()
+        for providers in self._by_type.values():
+            providers.clear()
+        self._registered.clear()
         self._tools.clear()
 
     def clear_tools(self) -> None:
@@ -229,7 +258,7 @@ class EchoKernel:
         else:
             tool_to_run = tool
 
-        if inspect.iscoroutinefunction(tool_to_run.func):
+        if tool_to_run.is_async:
             return await tool_to_run.func(**kwargs)
         else:
             loop = asyncio.get_running_loop()
@@ -10,6 +10,11 @@ class EchoTool:
         self.description = description
         self.parameters = parameters if parameters is not None else self._extract_parameters_from_callable()
 
+    @property
+    def is_async(self) -> bool:
+        """Whether the underlying function is a coroutine function, looking through decorators."""
+        return self._is_async
+
     def _extract_parameters_from_callable(self) -> Dict[str, Any]:
         """Extracts parameters from the tool's callable function."""
         try:
@@ -56,6 +61,9 @@ class EchoTool:
     def __setattr__(self, attr, value):
         if attr in ['name', 'func', 'description', 'parameters']:
             object.__setattr__(self, attr, value)
+            if attr == 'func':
+                # Decide sync vs async once instead of on every execution
+                object.__setattr__(self, '_is_async', inspect.iscoroutinefunction(inspect.unwrap(value)))
         else:
             raise AttributeError(f"'EchoTool' object has no attribute '{attr}'")
 
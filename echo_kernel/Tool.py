@@ -24,6 +24,8 @@ Example:
 from typing import Callable, Dict, Any, get_type_hints, Optional, List
 import inspect
 import functools
+import types
+import weakref
 
 def EchoTool(description: str = None, name: Optional[str] = None, parameters: Optional[Dict[str, Any]] = None) -> Callable:
     """
@@ -53,6 +55,28 @@ def EchoTool(description: str = None, name: Optional[str] = None, parameters: Op
         The decorated function must have type hints for all parameters and return value.
         The function name will be used as the tool name unless a custom name is provided.
     """
+    frozen_parameters = _freeze(parameters) if parameters is not None else None
+    try:
+        return _make_decorator(description, name, frozen_parameters)
+    except TypeError:
+        # Unhashable values in parameters: build an uncached decorator
+        return _make_decorator.__wrapped__(description, name, frozen_parameters)
+
+
+# Most decorator specs cached at once; bounded so tools built dynamically
+# (e.g. a schema per request) don't keep every decorator alive.
+_DECORATOR_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=_DECORATOR_CACHE_SIZE)
+def _make_decorator(description: Optional[str], name: Optional[str], frozen_parameters: Any) -> Callable:
+    """
+    Build the decorator for one (description, name, parameters) spec.
+
+    Cached, so every use of an identical ``@EchoTool(...)`` spec shares one
+    decorator. ``frozen_parameters`` is the hashable form produced by
+    ``_freeze`` and is thawed into a fresh dict for each decorated function.
+    """
     def decorator(func: Callable) -> Callable:
         # Validate parameters
         if description is not None and not description.strip():
@@ -60,6 +84,13 @@ def EchoTool(description: str = None, name: Optional[str] = None, parameters: Op
         if name is not None and not name.strip():
             raise ValueError("Name cannot be empty")
         
+        # Decorating the same plain function again with the same arguments
+        # returns the wrapper built the first time, skipping introspection
+        cache_key = (description, name, frozen_parameters)
+        cached = getattr(func, '__echo_tool__', None)
+        if cached is not None and cached[0] == cache_key and not hasattr(func, '_echo_tool_metadata'):
+            return cached[1]
+        
         # Get function signature and type hints
         sig = inspect.signature(func)
         type_hints = get_type_hints(func)
@@ -76,8 +107,8 @@ def EchoTool(description: str = None, name: Optional[str] = None, parameters: Op
             tool_description = func.__name__
         
         # Use custom parameters or extract from function signature
-        if parameters is not None:
-            tool_params = parameters
+        if frozen_parameters is not None:
+            tool_params = _thaw(frozen_parameters)
         else:
             # Extract parameter information
             param_properties = {}
@@ -117,7 +148,7 @@ def EchoTool(description: str = None, name: Optional[str] = None, parameters: Op
         }
         
         # Create tool metadata
-        tool_metadata = ToolMetadata(tool_name, tool_description, tool_params)
+        tool_metadata = ToolMetadata.intern(tool_name, tool_description, tool_params)
         
         # Check if function is already wrapped by another decorator
         if hasattr(func, '_echo_tool_metadata'):
@@ -128,21 +159,132 @@ def EchoTool(description: str = None, name: Optional[str] = None, parameters: Op
             func.description = tool_description
             return func
         
-        # Create a wrapper that preserves metadata
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
+        # Create a wrapper that carries the metadata
+        wrapper = _ToolWrapper(func, tool_metadata, tool_def, sig)
         
-        # Copy metadata to wrapper
-        wrapper._echo_tool_metadata = tool_metadata
-        wrapper.name = tool_name
-        wrapper.definition = tool_def
-        wrapper.description = tool_description
+        try:
+            func.__echo_tool__ = (cache_key, wrapper)
+        except (AttributeError, TypeError):
+            pass  # e.g. builtins, which don't accept attributes
         
         return wrapper
     
     return decorator
 
+
+# Callable returned by the EchoTool decorator.
+#
+# Metadata lives in slots rather than a per-function __dict__. The function's
+# identity (__name__, __doc__, __module__, ...) is read through from the
+# wrapped function, and __get__ lets it bind as a method. The signature taken
+# at decoration time is kept as __signature__, which inspect.signature returns
+# as-is instead of unwrapping __wrapped__ and rebuilding it on every call.
+# __dict__ is exposed read-only so functools.wraps in an outer decorator still
+# copies the tool metadata. (The __doc__ property shadows a class docstring,
+# hence this comment.)
+class _ToolWrapper:
+    __slots__ = (
+        '_fn', '_echo_tool_metadata', 'name', 'definition', 'description',
+        '__wrapped__', '__signature__', '__weakref__',
+    )
+    
+    def __init__(self, func: Callable, metadata: 'ToolMetadata', definition: Dict[str, Any],
+                 signature: inspect.Signature):
+        self._fn = func
+        self.__wrapped__ = func
+        self.__signature__ = signature
+        self._echo_tool_metadata = metadata
+        self.name = metadata.name
+        self.definition = definition
+        self.description = metadata.description
+    
+    def __call__(self, *args, **kwargs):
+        return self._fn(*args, **kwargs)
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return types.MethodType(self, instance)
+    
+    def __getattr__(self, attr):
+        # Only reached for names not held in slots, e.g. __name__ or
+        # attributes set on the original function
+        if attr == '_fn':
+            raise AttributeError(attr)
+        return getattr(self._fn, attr)
+    
+    @property
+    def __doc__(self):
+        return self._fn.__doc__
+    
+    @property
+    def __module__(self):
+        return self._fn.__module__
+    
+    @property
+    def __dict__(self):
+        return {
+            '_echo_tool_metadata': self._echo_tool_metadata,
+            'name': self.name,
+            'definition': self.definition,
+            'description': self.description,
+        }
+    
+    def __repr__(self):
+        return f"<EchoTool {self.name!r} wrapping {self._fn!r}>"
+
+
+# Tags marking the container type of a frozen value, so _thaw can rebuild it
+_DICT, _LIST, _TUPLE = object(), object(), object()
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Convert nested dicts/lists into hashable tagged tuples.
+    
+    Scalars are frozen as ``(type, value)`` so values that compare equal
+    across types, like True, 1 and 1.0, still give different keys.
+    """
+    if isinstance(value, dict):
+        return (_DICT, tuple((_freeze(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return (_LIST, tuple(_freeze(v) for v in value))
+    if isinstance(value, tuple):
+        return (_TUPLE, tuple(_freeze(v) for v in value))
+    return (type(value), value)
+
+
+def _thaw(value: Any) -> Any:
+    """Inverse of _freeze."""
+    tag, items = value
+    if tag is _DICT:
+        return {_thaw(k): _thaw(v) for k, v in items}
+    if tag is _LIST:
+        return [_thaw(v) for v in items]
+    if tag is _TUPLE:
+        return tuple(_thaw(v) for v in items)
+    return items
+
+def _freeze_schema(value: Any) -> Any:
+    """
+    Deep read-only copy of a JSON schema: dicts become MappingProxyType and
+    lists become tuples.
+    """
+    if isinstance(value, (dict, types.MappingProxyType)):
+        return types.MappingProxyType({k: _freeze_schema(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_schema(v) for v in value)
+    return value
+
+
+def _thaw_schema(value: Any) -> Any:
+    """Inverse of _freeze_schema: a fresh, mutable copy of a frozen schema."""
+    if isinstance(value, types.MappingProxyType):
+        return {k: _thaw_schema(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw_schema(v) for v in value]
+    return value
+
 def _python_type_to_json_type(python_type: str) -> str:
     """
     Convert Python type hints to JSON schema types.
@@ -179,27 +321,75 @@ def _python_type_to_json_type(python_type: str) -> str:
     return "object"
 
 class ToolMetadata:
-    """Metadata for EchoKernel tools."""
+    """
+    Metadata for EchoKernel tools.
+    
+    Instances are read-only once built, and ``parameters`` is a deep
+    read-only copy of the schema (nested dicts as MappingProxyType, lists as
+    tuples), so identical metadata can be shared through ToolMetadata.intern.
+    """
+    
+    __slots__ = ('name', 'description', 'parameters', '__weakref__')
     
     def __init__(self, name: str, description: str, parameters: Dict[str, Any] = None):
-        self.name = name
-        self.description = description
-        self.parameters = parameters or {}
+        object.__setattr__(self, 'name', name)
+        object.__setattr__(self, 'description', description)
+        object.__setattr__(self, 'parameters', _freeze_schema(parameters or {}))
+    
+    @classmethod
+    def intern(cls, name: str, description: str, parameters: Dict[str, Any] = None) -> 'ToolMetadata':
+        """
+        Return the shared ToolMetadata for these values, creating it if needed.
+        
+        Tools with identical name, description and parameter schema get the
+        same instance, which is safe because metadata is read-only. Schemas that
+        can't be hashed (e.g. a set default) get a fresh, uninterned instance.
+        """
+        key = (name, description, _freeze(parameters or {}))
+        try:
+            metadata = _METADATA_INTERN.get(key)
+        except TypeError:
+            return cls(name, description, parameters)
+        if metadata is None:
+            metadata = _METADATA_INTERN[key] = cls(name, description, parameters)
+        return metadata
+    
+    def __setattr__(self, attr, value):
+        raise AttributeError(f"ToolMetadata is read-only; cannot set {attr!r}")
+    
+    def __delattr__(self, attr):
+        raise AttributeError(f"ToolMetadata is read-only; cannot delete {attr!r}")
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert metadata to dictionary."""
+        """
+        Convert metadata to dictionary.
+        
+        Each call returns a fresh deep copy built from the frozen schema, so
+        callers may change it without affecting this (possibly shared) metadata.
+        """
         return {
             "name": self.name,
             "description": self.description,
-            "parameters": self.parameters
+            "parameters": _thaw_schema(self.parameters)
         }
     
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, ToolMetadata):
             return False
         return (self.name == other.name and 
                 self.description == other.description and 
                 self.parameters == other.parameters)
     
+    def __hash__(self):
+        # Consistent with __eq__ without hashing the (possibly unhashable) schema
+        return hash((self.name, self.description))
+    
     def __repr__(self):
-        return f"ToolMetadata(name='{self.name}', description='{self.description}')" 
\ No newline at end of file
+        return f"ToolMetadata(name='{self.name}', description='{self.description}')" 
+
+
+# Interned ToolMetadata, keyed by (name, description, frozen parameters).
+# Entries go away once no tool refers to them any more.
+_METADATA_INTERN: "weakref.WeakValueDictionary[Any, ToolMetadata]" = weakref.WeakValueDictionary()
@@ -0,0 +1,37 @@
+"""
+Optional JIT compilation helpers.
+
+Numeric predicates (score thresholds, stop conditions over arrays) can be
+compiled with numba when it is installed. Without numba the decorated
+function is returned unchanged, so callers never need to know which path
+is active.
+"""
+
+import warnings
+from typing import Callable
+
+
+def jit_predicate(fn: Callable) -> Callable:
+    """
+    Compile a numeric predicate with ``numba.njit(cache=True)`` when available.
+
+    The compiled machine code is cached on disk next to the module, so the
+    compilation cost is only paid on the first call of the first run.
+
+    Args:
+        fn: A function operating on numpy arrays and scalars only.
+
+    Returns:
+        The JIT-compiled function, or ``fn`` itself if numba is not installed
+        or cannot wrap the function.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return fn
+
+    try:
+        return njit(cache=True)(fn)
+    except Exception as e:
+        warnings.warn(f"Could not JIT-compile {fn.__name__}, using pure Python: {e}")
+        return fn
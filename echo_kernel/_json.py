@@ -0,0 +1,39 @@
+"""
+JSON helpers shared by the tools and text providers.
+
+orjson is used when it is installed (it is part of the ``speedups`` extra).
+The stdlib fallback produces the same output: compact by default, non-ASCII
+text kept as-is rather than escaped, and unknown objects written as ``str()``.
+"""
+
+from typing import Any
+
+try:
+    import orjson
+
+    def dumps(obj: Any, pretty: bool = False) -> str:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(obj, default=str, option=option).decode()
+
+    loads = orjson.loads
+except ImportError:
+    import json
+
+    def dumps(obj: Any, pretty: bool = False) -> str:
+        if pretty:
+            return json.dumps(obj, indent=2, ensure_ascii=False, default=str)
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, default=str)
+
+    loads = json.loads
+
+
+def tool_content(result: Any) -> str:
+    """
+    Turn a tool's return value into the content of a tool message.
+
+    Tools return plain data and are serialized here, once, at the boundary to
+    the model. Strings are passed through unchanged.
+    """
+    if isinstance(result, str):
+        return result
+    return dumps(result)
@@ -3,7 +3,8 @@ from echo_kernel.IEchoAgent import IEchoAgent
 from typing import Dict
 
 class LoopAgent(IEchoAgent):
-    def __init__(self, name: str, kernel, max_iterations: int = 3, stop_phrase: str = "Final version"):
+    def __init__(self, name: str, kernel, max_iterations: int = 3, stop_phrase: str = "Final version",
+                 memoize: bool = True):
         self._name = name
         self.kernel = kernel
         self.agent = EchoAgent(name, kernel)
@@ -11,6 +12,11 @@ class LoopAgent(IEchoAgent):
         self.max_steps = max_iterations  # For backward compatibility
         self.stop_phrase = stop_phrase
         self._iteration_count = 0
+        # Reuse the last result when a step would resend the exact same request,
+        # which happens once the model stops changing its output.
+        self.memoize = memoize
+        self._last_prompt = None
+        self._last_result = None
 
     @property
     def name(self) -> str:
@@ -40,13 +46,20 @@ class LoopAgent(IEchoAgent):
         """Iterate on a task with optional stop condition."""
         current_task = task
         self._iteration_count = 0
+        self._last_prompt = None
+        self._last_result = None
         
         for i in range(self.max_iterations):
             self._iteration_count = i + 1
             if self.kernel.agent_logging_enabled:
                 print(f"[{self.name}] Step {i+1}:")
-            result = await self.agent.run(current_task, temperature, max_tokens, top_p, 
-                                        frequency_penalty, presence_penalty, context, system_prompt)
+            request = (current_task, temperature, max_tokens, top_p,
+                       frequency_penalty, presence_penalty, context, system_prompt)
+            if self.memoize and self._last_prompt is not None and request == self._last_prompt:
+                result = self._last_result
+            else:
+                result = await self.agent.run(*request)
+                self._last_prompt, self._last_result = request, result
             if self.kernel.agent_logging_enabled:
                 print(result)
 
@@ -66,6 +79,8 @@ class LoopAgent(IEchoAgent):
         return result
 
     def reset(self) -> None:
-        """Reset the iteration counter."""
+        """Reset the iteration counter and the memoized last result."""
         self._iteration_count = 0
+        self._last_prompt = None
+        self._last_result = None
 
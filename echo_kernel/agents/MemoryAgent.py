@@ -2,15 +2,60 @@ from echo_kernel.EchoKernel import EchoKernel
 from echo_kernel.ITextMemory import ITextMemory
 from echo_kernel.IEchoAgent import IEchoAgent
 from echo_kernel.EchoAgent import EchoAgent
-from typing import Dict, Any, List
+from echo_kernel._jit import jit_predicate
+from typing import Dict, Any, List, Optional, Set
+import asyncio
+import numpy as np
+
+
+@jit_predicate
+def _score_mask(scores: np.ndarray, threshold: float) -> np.ndarray:
+    return scores >= threshold
+
+
+def _scores(results: List[Dict[str, Any]], dtype: type) -> np.ndarray:
+    """
+    Read the relevance of each search result into an array. Memory providers
+    report it as "similarity"; "score" is accepted as well.
+    """
+    return np.fromiter(
+        (r.get("similarity", r.get("score", 0.0)) for r in results), dtype=dtype, count=len(results)
+    )
+
+
+def _filter_by_score(results: List[Dict[str, Any]], threshold: float) -> List[Dict[str, Any]]:
+    """Keep only the search results whose score reaches the threshold."""
+    scores = _scores(results, np.float64)
+    mask = _score_mask(scores, threshold)
+    return [r for r, keep in zip(results, mask) if keep]
+
+
+def _top_k_by_score(results: List[Dict[str, Any]], k: int) -> List[Dict[str, Any]]:
+    """Select the k highest-scoring search results, best first."""
+    if k <= 0:
+        return []
+    scores = _scores(results, np.float32)
+    if k < len(results):
+        # Partial selection is O(n); only the k winners get sorted
+        idx = np.argpartition(-scores, k - 1)[:k]
+    else:
+        idx = np.arange(len(results))
+    idx = idx[np.argsort(-scores[idx], kind="stable")]
+    return [results[i] for i in idx]
 
 
 class MemoryAgent(IEchoAgent):
-    def __init__(self, name: str, kernel: EchoKernel, memory_interface: ITextMemory = None, agent: IEchoAgent = None):
+    def __init__(self, name: str, kernel: EchoKernel, memory_interface: ITextMemory = None, agent: IEchoAgent = None,
+                 min_score: Optional[float] = None, context_size: int = 10):
         self._name = name
         self.kernel = kernel
         self.memory = memory_interface or kernel.get_service(ITextMemory)
         self.agent = agent or EchoAgent(name, kernel)
+        self.min_score = min_score
+        self.context_size = context_size
+        # Memory writes still in flight, and errors from ones that failed; see flush()
+        self._pending_writes: Set[asyncio.Future] = set()
+        self._failed_writes: List[BaseException] = []
         
         if not self.memory:
             raise ValueError("No memory provider available")
@@ -38,13 +83,20 @@ class MemoryAgent(IEchoAgent):
                                 context: Dict = None, system_prompt: str = None) -> str:
         """Process a message with memory context."""
         # Search for similar past messages
-        similar = await self.memory.search_similar(message, limit=10)
+        similar = await self.memory.search_similar(message, limit=max(10, self.context_size))
+        if similar and self.min_score is not None:
+            similar = _filter_by_score(similar, self.min_score)
+        if similar:
+            similar = _top_k_by_score(similar, self.context_size)
         
         # Build context from similar messages
         context_text = "\n".join([f"- {r.get('text', str(r))}" for r in similar]) if similar else ""
         
-        # Add current message to memory
-        await self.memory.add_text(message, {"timestamp": "now", "agent": self.name})
+        # Add current message to memory in the background so the write
+        # overlaps with the LLM call below
+        write = asyncio.ensure_future(self.memory.add_text(message, {"timestamp": "now", "agent": self.name}))
+        self._pending_writes.add(write)
+        write.add_done_callback(self._write_done)
         
         # Process with context
         if context_text:
@@ -55,6 +107,24 @@ class MemoryAgent(IEchoAgent):
         return await self.agent.run(full_prompt, temperature, max_tokens, top_p, 
                                   frequency_penalty, presence_penalty, context, system_prompt)
 
+    def _write_done(self, write: asyncio.Future) -> None:
+        self._pending_writes.discard(write)
+        if not write.cancelled() and write.exception() is not None:
+            self._failed_writes.append(write.exception())
+
+    async def flush(self) -> None:
+        """
+        Wait for background memory writes started by process_with_memory.
+        
+        Raises the first error from a write that failed since the last flush.
+        """
+        if self._pending_writes:
+            await asyncio.gather(*self._pending_writes, return_exceptions=True)
+        if self._failed_writes:
+            error = self._failed_writes[0]
+            self._failed_writes.clear()
+            raise error
+
     async def add_to_memory(self, text: str, metadata: Dict[str, Any] = None) -> None:
         """Add text to memory."""
         await self.memory.add_text(text, metadata or {})
@@ -1,6 +1,8 @@
 from echo_kernel.EchoKernel import EchoKernel
 from echo_kernel.IEchoAgent import IEchoAgent
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import re
 
 
 class SpecialistRouterAgent(IEchoAgent):
@@ -11,7 +13,7 @@ class SpecialistRouterAgent(IEchoAgent):
         self.router_prompt = router_prompt or (
             "Given a subtask, choose the most appropriate specialist agent to handle it.\n"
             f"Available agents: {', '.join(self.agents.keys())}\n"
-            "Respond with the name only."
+            "Respond with agent names only, best first, separated by commas."
         )
         self.max_retries = max_retries
 
@@ -36,55 +38,92 @@ class SpecialistRouterAgent(IEchoAgent):
     async def route_with_validation(self, task: str, temperature: float = 0.7, max_tokens: int = 1000, 
                                   top_p: float = 1, frequency_penalty: float = 0, presence_penalty: float = 0, 
                                   context: Dict = None, system_prompt: str = None, validator=None) -> str:
-        """Route a task with validation of agent selection."""
+        """
+        Route a task with validation of agent selection.
+
+        The router is asked for a ranked list of candidate agents. When a validator
+        is supplied, the top candidates (up to the remaining retry budget) run
+        concurrently and the first result that passes validation wins; the slower
+        candidates are cancelled. Every specialist run and every invalid routing
+        answer counts as one attempt.
+        """
         routing_prompt = f"{self.router_prompt}\nSubtask: {task}"
 
         attempts = 0
         while attempts < self.max_retries:
             # Get routing decision
-            agent_name = (await self.kernel.generate_text(routing_prompt, temperature=temperature, 
-                                                         max_tokens=max_tokens, top_p=top_p, 
-                                                         frequency_penalty=frequency_penalty, 
-                                                         presence_penalty=presence_penalty, 
-                                                         context=context, system_prompt=system_prompt)).strip()
-            
-            if agent_name in self.agents:
-                agent = self.agents[agent_name]
+            ranking = (await self.kernel.generate_text(routing_prompt, temperature=temperature, 
+                                                      max_tokens=max_tokens, top_p=top_p, 
+                                                      frequency_penalty=frequency_penalty, 
+                                                      presence_penalty=presence_penalty, 
+                                                      context=context, system_prompt=system_prompt)).strip()
+            candidates = self._parse_candidates(ranking)
+
+            if candidates:
+                # Without a validator any result is accepted, so only the top pick runs
+                limit = 1 if validator is None else self.max_retries - attempts
+                candidates = candidates[:limit]
+                attempts += len(candidates)
                 if self.kernel.agent_logging_enabled:
-                    print(f"[{self.name}] Routing to agent: {agent_name}")
-                
-                # Execute the task
-                result = await agent.run(task, temperature, max_tokens, top_p, 
-                                       frequency_penalty, presence_penalty, context, system_prompt)
-                
-                # If no validator, return result immediately
-                if validator is None:
-                    if self.kernel.agent_logging_enabled:
-                        print(f"[DEBUG] No validator provided, returning result")
+                    print(f"[{self.name}] Routing to agent(s): {', '.join(candidates)}")
+
+                found, result = await self._first_valid_result(candidates, task, validator, temperature, max_tokens, 
+                                                               top_p, frequency_penalty, presence_penalty, 
+                                                               context, system_prompt)
+                if found:
                     return result
-                else:
-                    if self.kernel.agent_logging_enabled:
-                        print(f"[DEBUG] Validator provided, calling validator")
-                    # Validate result
-                    if validator(result):
-                        if self.kernel.agent_logging_enabled:
-                            print(f"[DEBUG] Validation passed")
-                        return result
-                    else:
-                        if self.kernel.agent_logging_enabled:
-                            print(f"[DEBUG] Validation failed, retrying...")
-                        # Validation failed, try again
-                        routing_prompt = f"Previous result failed validation. Please choose a different agent from: {', '.join(self.agents.keys())}\nSubtask: {task}"
+
+                if self.kernel.agent_logging_enabled:
+                    print(f"[DEBUG] Validation failed, retrying...")
+                # Validation failed, try again
+                routing_prompt = f"Previous result failed validation. Please choose a different agent from: {', '.join(self.agents.keys())}\nSubtask: {task}"
             else:
                 if self.kernel.agent_logging_enabled:
-                    print(f"[DEBUG] Invalid agent name: {agent_name}")
+                    print(f"[DEBUG] Invalid agent name: {ranking}")
                 # Invalid agent name, try again
                 routing_prompt = f"The previous agent name was invalid. Please choose from the following list: {', '.join(self.agents.keys())}\nSubtask: {task}"
-            attempts += 1
+                attempts += 1
 
         # If we get here, all retries failed
         raise ValueError(f"Failed to route task after {self.max_retries} attempts")
 
+    def _parse_candidates(self, ranking: str) -> List[str]:
+        """Extract known agent names, best first, from a routing answer."""
+        candidates = []
+        for name in re.split(r"[,\n]", ranking):
+            name = name.strip()
+            if name in self.agents and name not in candidates:
+                candidates.append(name)
+        return candidates
+
+    async def _first_valid_result(self, candidates: List[str], task: str, validator, temperature: float, 
+                                  max_tokens: int, top_p: float, frequency_penalty: float, 
+                                  presence_penalty: float, context: Dict, system_prompt: str) -> Tuple[bool, Optional[str]]:
+        """
+        Run candidates concurrently and return the first result accepted by the validator.
+        Candidates that finish together are considered in ranking order.
+        """
+        ranked = [
+            asyncio.ensure_future(self.agents[name].run(task, temperature, max_tokens, top_p, 
+                                                        frequency_penalty, presence_penalty, context, system_prompt))
+            for name in candidates
+        ]
+        pending = set(ranked)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for finished in (future for future in ranked if future in done):
+                    result = finished.result()
+                    if validator is None or validator(result):
+                        return True, result
+            return False, None
+        finally:
+            # Cancel the slower candidates once a winner is found (or on error)
+            for straggler in pending:
+                straggler.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
     async def route_with_retries(self, task: str, temperature: float = 0.7, max_tokens: int = 1000, 
                                top_p: float = 1, frequency_penalty: float = 0, presence_penalty: float = 0, 
                                context: Dict = None, system_prompt: str = None) -> str:
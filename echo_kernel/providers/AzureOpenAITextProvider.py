@@ -1,9 +1,11 @@
-from typing import Dict, List
+from typing import Any, Dict, List
 from echo_kernel.ITextProvider import ITextProvider
+from echo_kernel._json import tool_content
 from openai import AzureOpenAI
 from openai import RateLimitError
 import json
 import asyncio
+import inspect
 
 class AzureOpenAITextProvider(ITextProvider):
     def __init__(self, api_key: str, api_base: str, api_version: str, model: str):
@@ -71,18 +73,21 @@ class AzureOpenAITextProvider(ITextProvider):
                 for tool_call in tool_content:
                     tool_name = tool_call.function.name
                     tool_result = await self.call_tool(tool_name, tool_call.function.arguments, tool_implementations)
-                    messages.append({"role": "tool", "tool_call_id": tool_call.id, "content": tool_result})
+                    messages.append({"role": "tool", "tool_call_id": tool_call.id, "content": tool_content(tool_result)})
             else:
                 break
 
         return message_content
 
-    async def call_tool(self, tool_name: str, args, tool_implementations: Dict) -> str:
+    async def call_tool(self, tool_name: str, args, tool_implementations: Dict) -> Any:
         if tool_name in tool_implementations:
             # Parse the JSON string into a dictionary
             args_dict = json.loads(args)
             tool = tool_implementations[tool_name]
             # Pass the values as keyword arguments
-            return tool(**args_dict)
+            result = tool(**args_dict)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
         else:
             return f"Tool {tool_name} not found"
\ No newline at end of file
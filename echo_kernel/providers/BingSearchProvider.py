@@ -25,6 +25,7 @@ import asyncio
 import time
 from typing import Dict, List, Optional
 from ..ISearchProvider import ISearchProvider
+from ._http import session_scope
 import json
 
 class BingSearchProvider(ISearchProvider):
@@ -39,20 +40,24 @@ class BingSearchProvider(ISearchProvider):
         base_url: Base URL for Bing Search API
         last_request_time: Timestamp of last request for rate limiting
         rate_limit_delay: Minimum delay between requests in seconds
+        session: Shared aiohttp session, or None to open one per search
     """
     
-    def __init__(self, api_key: str, rate_limit_delay: float = 1.0):
+    def __init__(self, api_key: str, rate_limit_delay: float = 1.0, session: Optional[aiohttp.ClientSession] = None):
         """
         Initialize a new BingSearchProvider instance.
         
         Args:
             api_key: Bing Search API key for authentication
             rate_limit_delay: Minimum delay between requests in seconds (default: 1.0)
+            session: Optional aiohttp session to reuse across searches. The
+                provider never closes an injected session; its owner does.
         """
         self.api_key = api_key
         self.base_url = "https://api.bing.microsoft.com/v7.0/search"
         self.last_request_time = 0
         self.rate_limit_delay = rate_limit_delay
+        self.session = session
 
     def _rate_limit(self):
         """
@@ -108,7 +113,7 @@ class BingSearchProvider(ISearchProvider):
                 'Ocp-Apim-Subscription-Key': self.api_key
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with session_scope(self.session) as session:
                 async with session.get(self.base_url, params=params, headers=headers, timeout=30) as response:
                     if response.status != 200:
                         error_text = await response.text()
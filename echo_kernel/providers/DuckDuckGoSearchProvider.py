@@ -26,6 +26,7 @@ import asyncio
 import time
 from typing import Dict, List, Optional
 from ..ISearchProvider import ISearchProvider
+from ._http import session_scope
 import json
 
 class DuckDuckGoSearchProvider(ISearchProvider):
@@ -40,18 +41,22 @@ class DuckDuckGoSearchProvider(ISearchProvider):
         base_url: Base URL for DuckDuckGo Instant Answer API
         last_request_time: Timestamp of last request for rate limiting
         rate_limit_delay: Minimum delay between requests in seconds
+        session: Shared aiohttp session, or None to open one per search
     """
     
-    def __init__(self, rate_limit_delay: float = 1.0):
+    def __init__(self, rate_limit_delay: float = 1.0, session: Optional[aiohttp.ClientSession] = None):
         """
         Initialize a new DuckDuckGoSearchProvider instance.
         
         Args:
             rate_limit_delay: Minimum delay between requests in seconds (default: 1.0)
+            session: Optional aiohttp session to reuse across searches. The
+                provider never closes an injected session; its owner does.
         """
         self.base_url = "https://api.duckduckgo.com/"
         self.last_request_time = 0
         self.rate_limit_delay = rate_limit_delay
+        self.session = session
 
     def _rate_limit(self):
         """
@@ -98,7 +103,7 @@ class DuckDuckGoSearchProvider(ISearchProvider):
                 'skip_disambig': '1'
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with session_scope(self.session) as session:
                 async with session.get(self.base_url, params=params, timeout=30) as response:
                     if response.status != 200:
                         return {
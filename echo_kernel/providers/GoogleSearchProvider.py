@@ -26,6 +26,7 @@ import asyncio
 import time
 from typing import Dict, List, Optional
 from ..ISearchProvider import ISearchProvider
+from ._http import session_scope
 import json
 
 class GoogleSearchProvider(ISearchProvider):
@@ -41,9 +42,10 @@ class GoogleSearchProvider(ISearchProvider):
         base_url: Base URL for Google Custom Search API
         last_request_time: Timestamp of last request for rate limiting
         rate_limit_delay: Minimum delay between requests in seconds
+        session: Shared aiohttp session, or None to open one per search
     """
     
-    def __init__(self, api_key: str, search_engine_id: str, rate_limit_delay: float = 1.0):
+    def __init__(self, api_key: str, search_engine_id: str, rate_limit_delay: float = 1.0, session: Optional[aiohttp.ClientSession] = None):
         """
         Initialize a new GoogleSearchProvider instance.
         
@@ -51,12 +53,15 @@ class GoogleSearchProvider(ISearchProvider):
             api_key: Google API key for authentication
             search_engine_id: Custom Search Engine ID
             rate_limit_delay: Minimum delay between requests in seconds (default: 1.0)
+            session: Optional aiohttp session to reuse across searches. The
+                provider never closes an injected session; its owner does.
         """
         self.api_key = api_key
         self.search_engine_id = search_engine_id
         self.base_url = "https://www.googleapis.com/customsearch/v1"
         self.last_request_time = 0
         self.rate_limit_delay = rate_limit_delay
+        self.session = session
 
     def _rate_limit(self):
         """
@@ -107,7 +112,7 @@ class GoogleSearchProvider(ISearchProvider):
                 'num': min(max_results, 10)  # Google API limit
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with session_scope(self.session) as session:
                 async with session.get(self.base_url, params=params, timeout=30) as response:
                     if response.status != 200:
                         error_text = await response.text()
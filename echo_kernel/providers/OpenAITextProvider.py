@@ -1,9 +1,11 @@
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 import openai
 import json
 import asyncio
+import inspect
 from openai import RateLimitError
 from ..ITextProvider import ITextProvider
+from .._json import tool_content
 
 class OpenAITextProvider(ITextProvider):
     def __init__(self, api_key: str, model: str = "gpt-3.5-turbo"):
@@ -69,20 +71,23 @@ class OpenAITextProvider(ITextProvider):
                         "role": "tool",
                         "tool_call_id": tool_call.id,
                         "name": function_name,
-                        "content": str(tool_result)
+                        "content": tool_content(tool_result)
                     })
             else:
                 # No more tool calls, return the final response
                 return message_content
 
-    async def call_tool(self, tool_name: str, args: str, tool_implementations: Optional[Dict] = None) -> str:
+    async def call_tool(self, tool_name: str, args: str, tool_implementations: Optional[Dict] = None) -> Any:
         if tool_implementations and tool_name in tool_implementations:
             try:
                 # Parse the JSON string into a dictionary
                 args_dict = json.loads(args)
                 tool = tool_implementations[tool_name]
                 # Pass the values as keyword arguments
-                return tool(**args_dict)
+                result = tool(**args_dict)
+                if inspect.isawaitable(result):
+                    result = await result
+                return result
             except Exception as e:
                 return f"Error executing tool {tool_name}: {str(e)}"
         else:
@@ -0,0 +1,21 @@
+"""
+aiohttp helpers shared by the search providers.
+"""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import aiohttp
+
+
+@asynccontextmanager
+async def session_scope(session: Optional[aiohttp.ClientSession]) -> AsyncIterator[aiohttp.ClientSession]:
+    """
+    Yield ``session``, or when it is None a new session that is closed
+    afterwards. An injected session is never closed here; its owner does that.
+    """
+    if session is not None:
+        yield session
+    else:
+        async with aiohttp.ClientSession() as new_session:
+            yield new_session
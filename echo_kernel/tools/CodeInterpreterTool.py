@@ -26,29 +26,58 @@ Example:
     ```
 """
 
-from typing import Dict, Any, List
+import functools
+from typing import TYPE_CHECKING, Dict, Any, List
 from echo_kernel.EchoTool import EchoTool
-from .code_interpreter import CodeInterpreter
+from echo_kernel._json import dumps as _dumps, loads as _loads
 
-interpreter = CodeInterpreter()
+if TYPE_CHECKING:
+    from .code_interpreter import CodeInterpreter
 
-def execute_python_code(code: str) -> Dict[str, Any]:
+@functools.lru_cache(maxsize=None)
+def _get_interpreter() -> "CodeInterpreter":
+    """
+    Returns the shared CodeInterpreter, creating it on first use.
+    The sandbox module is imported here so importing the tool stays cheap.
+    :return: The interpreter every execute_python_code call runs through.
+    """
+    from .code_interpreter import CodeInterpreter
+    return CodeInterpreter()
+
+def execute_python_code(code: str) -> str:
     """
     Executes Python code in a sandboxed environment.
     :param code: The Python code to execute.
-    :return: A dictionary containing the result of the execution.
+    :return: A compact JSON object with the execution's stdout, stderr and success flag.
+    """
+    stdout, stderr = _get_interpreter().execute_code(code)
+    success = not stderr or stderr.isspace()
+    result = {"stdout": stdout, "stderr": stderr, "success": success}
+    return _dumps(result)
+
+def pretty_result(result: str) -> str:
     """
-    return interpreter.execute_code(code)
+    Re-indents an execute_python_code result for human readers.
+    :param result: The JSON string returned by execute_python_code.
+    :return: The same result, indented.
+    """
+    return _dumps(_loads(result), pretty=True)
+
+@functools.lru_cache(maxsize=None)
+def _execute_python_code_tool() -> EchoTool:
+    """
+    Returns the single EchoTool for execute_python_code, built on first use.
+    :return: The execute_python_code tool.
+    """
+    return EchoTool(
+        name="execute_python_code",
+        description="Executes Python code in a sandboxed environment.",
+        func=execute_python_code,
+    )
 
 def code_interpreter_tools() -> List[EchoTool]:
     """
     Returns a list of code interpreter tools.
     :return: A list of code interpreter tools.
     """
-    return [
-        EchoTool(
-            name="execute_python_code",
-            description="Executes Python code in a sandboxed environment.",
-            func=execute_python_code,
-        )
-    ] 
\ No newline at end of file
+    return [_execute_python_code_tool()] 
\ No newline at end of file
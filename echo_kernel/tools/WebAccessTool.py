@@ -16,11 +16,12 @@ The web access tool:
 
 Example:
     ```python
-    from tools.WebAccessTool import get_web_content, search_web
+    from tools.WebAccessTool import get_web_content, get_web_contents, search_web
     from echo_kernel.providers.DuckDuckGoSearchProvider import DuckDuckGoSearchProvider
     
     # Register with kernel
     kernel.register_tool(get_web_content)
+    kernel.register_tool(get_web_contents)
     kernel.register_tool(search_web)
     
     # AI can now use the tool to access web content and search
@@ -31,13 +32,135 @@ Example:
 """
 
 import asyncio
-from typing import Any, Dict, List
+import atexit
+import functools
+import random
+import re
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from echo_kernel.EchoTool import EchoTool
 
+from .rate_limiter import HostRateLimiter, TokenBucket
 from .web_access import WebAccess
 
-web_access = WebAccess()
+if TYPE_CHECKING:
+    import aiohttp
+
+# Requests are paced by per-host token buckets rather than by WebAccess's
+# fixed per-request delay: bursts of up to 5, then 1 request per second to
+# any one host, while different hosts are fetched in parallel. Searches all
+# go to the search provider, so they share the "search" bucket.
+web_access = WebAccess(rate_limit_delay=0)
+_LIMITER = HostRateLimiter(capacity=5, rate=1.0)
+_SEARCH_BUCKET_KEY = "search"
+
+# Retry policy for transient failures: exponential backoff with jitter,
+# delay = min(cap, base * 2**attempt) * uniform(0.5, 1.5).
+_MAX_ATTEMPTS = 5
+_RETRY_BASE = 0.25
+_RETRY_CAP = 8.0
+
+# Errors worth retrying, as reported by WebAccess and the search providers:
+# throttling/unavailable status codes, timeouts and connection failures.
+_RETRYABLE_ERROR_RE = re.compile(r'^(?:HTTP (?:429|502|503|504)\b|Request timed out|Connection error|Network error)')
+
+# Most pages get_web_contents fetches at the same time; the executor's
+# threads and the per-host token buckets bound the real concurrency further.
+_FETCH_CONCURRENCY = 16
+
+# aiohttp sessions shared by search_web calls, one per event loop, each with
+# the guard that closes it when its loop shuts down. Opened lazily by
+# _get_session.
+_SESSIONS: Dict[asyncio.AbstractEventLoop, Tuple["aiohttp.ClientSession", AsyncGenerator[None, None]]] = {}
+
+async def _close_with_loop(session: "aiohttp.ClientSession") -> AsyncGenerator[None, None]:
+    """
+    Parks at its yield for as long as the session's loop runs. asyncio.run()
+    and loop.shutdown_asyncgens() close every such generator before the loop
+    is closed, so the session is closed while its loop can still run the
+    cleanup, even when each call gets its own asyncio.run().
+    """
+    try:
+        yield
+    finally:
+        await session.close()
+
+def _get_session() -> Optional["aiohttp.ClientSession"]:
+    """
+    Returns the running loop's shared aiohttp session, opening it on first use.
+    A new session is opened if the old one was closed. Sessions of loops that
+    have since been closed are forgotten.
+    :return: The shared session, or None if aiohttp is not installed.
+    """
+    try:
+        import aiohttp
+    except ImportError:
+        return None
+    loop = asyncio.get_running_loop()
+    for stale in [other for other in _SESSIONS if other.is_closed()]:
+        del _SESSIONS[stale]
+    session, _ = _SESSIONS.get(loop, (None, None))
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=64, ttl_dns_cache=300, keepalive_timeout=30)
+        )
+        guard = _close_with_loop(session)
+        asyncio.ensure_future(guard.__anext__())
+        _SESSIONS[loop] = (session, guard)
+    return session
+
+async def close_session() -> None:
+    """
+    Closes the running loop's shared aiohttp session. Call this from the application's async shutdown.
+    """
+    session, _ = _SESSIONS.pop(asyncio.get_running_loop(), (None, None))
+    if session is not None and not session.closed:
+        await session.close()
+
+@atexit.register
+def _close_session_at_exit() -> None:
+    # Best effort for loops that were never shut down and whose application
+    # never called close_session(): only possible while the loop still
+    # exists and is idle.
+    for loop, (session, _) in list(_SESSIONS.items()):
+        if not session.closed and not loop.is_closed() and not loop.is_running():
+            loop.run_until_complete(session.close())
+    _SESSIONS.clear()
+
+def _retry_delay(attempt: int, result: Dict[str, Any]) -> Optional[float]:
+    """
+    Returns how long to wait before retrying a failed request, or None to give up.
+    :param attempt: Zero-based number of the attempt that just failed.
+    :param result: The failed result, which may carry a 'retry_after' hint.
+    :return: Seconds to wait, or None if the failure should be returned as-is.
+    """
+    if not _RETRYABLE_ERROR_RE.match(result.get('error') or ''):
+        return None
+    retry_after = result.get('retry_after')
+    if retry_after is not None:
+        # Honour the server, but don't hold a tool call open for minutes
+        return retry_after if retry_after <= _RETRY_CAP else None
+    return min(_RETRY_CAP, _RETRY_BASE * 2 ** attempt) * random.uniform(0.5, 1.5)
+
+async def _with_retries(call: Callable[[], Awaitable[Dict[str, Any]]], bucket: TokenBucket) -> Dict[str, Any]:
+    """
+    Runs a rate-limited request, retrying transient failures with backoff.
+    :param call: Makes one attempt and returns a result dictionary.
+    :param bucket: The token bucket pacing requests to the target host.
+    :return: The first successful result, or the last failure.
+    """
+    for attempt in range(_MAX_ATTEMPTS):
+        await bucket.acquire()
+        result = await call()
+        if result.get('success') or attempt == _MAX_ATTEMPTS - 1:
+            return result
+        delay = _retry_delay(attempt, result)
+        if delay is None:
+            return result
+        # Upstream is struggling: give up our burst allowance as well
+        bucket.drain()
+        await asyncio.sleep(delay)
+    return result
 
 async def search_web(query: str, max_results: int = 5) -> Dict[str, Any]:
     """
@@ -48,7 +171,10 @@ async def search_web(query: str, max_results: int = 5) -> Dict[str, Any]:
     """
     if max_results is None:
         max_results = 5
-    return await web_access.search_web(query, max_results=max_results)
+    return await _with_retries(
+        lambda: web_access.search_web(query, max_results=max_results, session=_get_session()),
+        _LIMITER.for_host(_SEARCH_BUCKET_KEY),
+    )
 
 async def get_web_content(url: str) -> Dict[str, Any]:
     """
@@ -56,7 +182,30 @@ async def get_web_content(url: str) -> Dict[str, Any]:
     :param url: The URL of the web page.
     :return: A dictionary containing the content of the web page.
     """
-    return await web_access.get_page_content(url)
+    # get_page_content uses blocking requests, so keep it off the event loop
+    loop = asyncio.get_running_loop()
+    return await _with_retries(
+        lambda: loop.run_in_executor(None, functools.partial(web_access.get_page_content, url)),
+        _LIMITER.for_url(url),
+    )
+
+async def get_web_contents(urls: List[str]) -> List[Dict[str, Any]]:
+    """
+    Asynchronously gets the content of several web pages at once.
+    :param urls: The URLs of the web pages.
+    :return: One get_web_content result per URL, in the order given.
+    """
+    # Fetch repeated URLs only once
+    unique_urls = list(dict.fromkeys(urls))
+    semaphore = asyncio.Semaphore(_FETCH_CONCURRENCY)
+
+    async def fetch(url: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await get_web_content(url)
+
+    results = await asyncio.gather(*(fetch(url) for url in unique_urls))
+    by_url = dict(zip(unique_urls, results))
+    return [by_url[url] for url in urls]
 
 def web_access_tools() -> List[EchoTool]:
     """
@@ -74,4 +223,9 @@ def web_access_tools() -> List[EchoTool]:
             description="Gets the content of a web page.",
             func=get_web_content,
         ),
+        EchoTool(
+            name="get_web_contents",
+            description="Gets the content of several web pages at once.",
+            func=get_web_contents,
+        ),
     ] 
\ No newline at end of file
@@ -6,12 +6,13 @@ including web access tools, code interpreter tools, and other utilities.
 """
 
 from .web_access import WebAccess
-from .WebAccessTool import get_web_content, search_web
+from .WebAccessTool import get_web_content, get_web_contents, search_web
 from .CodeInterpreterTool import execute_python_code
 
 __all__ = [
     'WebAccess',
     'get_web_content', 
+    'get_web_contents',
     'search_web',
     'execute_python_code'
 ] 
\ No newline at end of file
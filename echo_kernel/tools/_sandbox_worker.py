@@ -0,0 +1,237 @@
+"""
+Warm sandbox worker for CodeInterpreter.
+
+CodeInterpreter starts this file once with
+``python -c <source> <limits> <timeout> <preload>`` and keeps it running. The worker reads length-prefixed code blocks from stdin
+and runs each one in a freshly forked child, so executions skip interpreter
+start-up but never share state. Each child:
+
+- runs in its own process group with stdin on /dev/null
+- applies the sandbox resource limits
+- executes the code as ``__main__`` with stdout/stderr on pipes
+
+Before reading any code the worker imports the comma-separated ``<preload>``
+modules, so children inherit them already loaded instead of importing them
+on every run.
+
+Code is compiled in the worker before forking, and the last 64 code objects are
+cached by source hash, so re-submitted snippets are not parsed again.
+
+For every code block the worker writes back one frame:
+(returncode, timed_out, stdout bytes, stderr bytes).
+
+This module is never imported; CodeInterpreter only reads its source. It must
+stay importable on its own, without EchoKernel on the path.
+"""
+
+import builtins
+import hashlib
+import importlib
+import json
+import linecache
+import os
+import selectors
+import signal
+import struct
+import sys
+import threading
+import time
+import traceback
+import types
+from collections import OrderedDict
+
+# Imported once here so forked children inherit it instead of loading it per run
+try:
+    import resource
+except ImportError:  # Windows, where the worker is never started
+    resource = None
+
+_LENGTH = struct.Struct('>I')
+_RESULT = struct.Struct('>i?II')
+
+# Compiled code objects keyed by a hash of their source, most recent last
+_CODE_CACHE = OrderedDict()
+_CODE_CACHE_SIZE = 64
+
+
+def _read_exact(stream, size):
+    """Read exactly ``size`` bytes, or return None at end of input."""
+    data = b''
+    while len(data) < size:
+        chunk = stream.read(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+def _preload(names):
+    """Import the named modules, skipping any that are missing or fail to import."""
+    for name in names:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass
+
+
+def _compile(code):
+    """
+    Compile ``code``, reusing the code object of an identical earlier block.
+
+    Compiling in the worker rather than in the child means the cache outlives
+    each execution, so re-submitted snippets skip parsing entirely.
+    """
+    key = hashlib.blake2b(code.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+    code_obj = _CODE_CACHE.get(key)
+    if code_obj is not None:
+        _CODE_CACHE.move_to_end(key)
+        return code_obj
+    code_obj = compile(code, '<cell>', 'exec')
+    _CODE_CACHE[key] = code_obj
+    if len(_CODE_CACHE) > _CODE_CACHE_SIZE:
+        _CODE_CACHE.popitem(last=False)
+    return code_obj
+
+
+def _run_child(code, code_obj, limits):
+    """Run one compiled code block in the forked child. Never returns."""
+    exit_code = 0
+    try:
+        os.setpgid(0, 0)
+        if limits:
+            for name, value in limits.items():
+                resource.setrlimit(getattr(resource, name), (value, value))
+
+        sys.stdin = open(os.devnull, 'r')
+        sys.stdout = open(1, 'w', encoding='utf-8', errors='backslashreplace', closefd=False)
+        sys.stderr = open(2, 'w', encoding='utf-8', errors='backslashreplace', closefd=False)
+
+        # The cache holds code other callers submitted; this run must not see it
+        _CODE_CACHE.clear()
+
+        # Let tracebacks show the offending source lines
+        linecache.cache['<cell>'] = (len(code), None, code.splitlines(True), '<cell>')
+        # Run as a real __main__ module so pickle and friends can find names
+        main_module = types.ModuleType('__main__')
+        main_module.__builtins__ = builtins
+        sys.modules['__main__'] = main_module
+        exec(code_obj, main_module.__dict__)
+
+        # Mirror normal interpreter shutdown
+        for thread in threading.enumerate():
+            if thread is not threading.main_thread() and not thread.daemon:
+                thread.join()
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            exit_code = e.code or 0
+        else:
+            print(e.code, file=sys.stderr)
+            exit_code = 1
+    except BaseException:
+        # Drop this frame so the traceback starts in the user's code
+        exc_type, exc, tb = sys.exc_info()
+        traceback.print_exception(exc_type, exc, tb.tb_next)
+        exit_code = 1
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(exit_code)
+
+
+def _execute(code, limits, timeout):
+    """Fork a child for ``code`` and collect its output, killing it after ``timeout`` seconds."""
+    try:
+        code_obj = _compile(code)
+    except (SyntaxError, ValueError) as e:
+        message = ''.join(traceback.format_exception_only(type(e), e))
+        return 1, False, b'', message.encode('utf-8', 'backslashreplace')
+
+    out_r, out_w = os.pipe()
+    err_r, err_w = os.pipe()
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    pid = os.fork()
+    if pid == 0:
+        os.dup2(devnull, 0)
+        os.dup2(out_w, 1)
+        os.dup2(err_w, 2)
+        os.closerange(3, 1 << 16)
+        _run_child(code, code_obj, limits)
+    os.close(devnull)
+    os.close(out_w)
+    os.close(err_w)
+
+    deadline = time.monotonic() + timeout
+    output = {out_r: [], err_r: []}
+    timed_out = False
+    with selectors.DefaultSelector() as selector:
+        selector.register(out_r, selectors.EVENT_READ)
+        selector.register(err_r, selectors.EVENT_READ)
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                timed_out = True
+                break
+            for key, _ in selector.select(remaining):
+                chunk = os.read(key.fd, 65536)
+                if chunk:
+                    output[key.fd].append(chunk)
+                else:
+                    selector.unregister(key.fd)
+
+    # The pipes can close before the child exits, so keep watching the clock.
+    # A child that closed its pipes is normally exiting, so poll quickly at
+    # first and back off only if it lingers.
+    delay = 0.00005
+    while not timed_out:
+        done, status = os.waitpid(pid, os.WNOHANG)
+        if done:
+            break
+        if time.monotonic() >= deadline:
+            timed_out = True
+        else:
+            time.sleep(delay)
+            delay = min(delay * 2, 0.005)
+    if timed_out:
+        try:
+            os.killpg(pid, signal.SIGKILL)
+        except OSError:
+            pass
+        _, status = os.waitpid(pid, 0)
+
+    os.close(out_r)
+    os.close(err_r)
+    if os.WIFSIGNALED(status):
+        returncode = -os.WTERMSIG(status)
+    else:
+        returncode = os.WEXITSTATUS(status)
+    return returncode, timed_out, b''.join(output[out_r]), b''.join(output[err_r])
+
+
+def main():
+    limits = json.loads(sys.argv[1])
+    timeout = float(sys.argv[2])
+    _preload(filter(None, sys.argv[3].split(',')))
+    requests = sys.stdin.buffer
+    responses = sys.stdout.buffer
+    while True:
+        header = _read_exact(requests, _LENGTH.size)
+        if header is None:
+            return
+        code = _read_exact(requests, _LENGTH.unpack(header)[0])
+        if code is None:
+            return
+        try:
+            # Lone surrogates travel as surrogatepass-encoded UTF-8 and fail to compile
+            code = code.decode('utf-8', 'surrogatepass')
+        except UnicodeDecodeError as e:
+            returncode, timed_out, stdout, stderr = 1, False, b'', f'{type(e).__name__}: {e}\n'.encode()
+        else:
+            returncode, timed_out, stdout, stderr = _execute(code, limits, timeout)
+        responses.write(_RESULT.pack(returncode, timed_out, len(stdout), len(stderr)) + stdout + stderr)
+        responses.flush()
+
+
+if __name__ == '__main__':
+    main()
@@ -6,19 +6,28 @@ and safety measures. It's designed to prevent malicious code execution while all
 legitimate code to run for educational and development purposes.
 
 The CodeInterpreter class:
-- Creates isolated temporary directories for code execution
+- Runs code in a temporary directory, outside the caller's working directory
 - Sets resource limits (CPU, memory, file size, open files)
 - Implements timeouts to prevent infinite loops
 - Cleans up resources automatically
 - Works cross-platform (Windows, Linux, macOS)
 
+On POSIX systems code runs through a warm worker process (see
+``_sandbox_worker.py``) that forks a fresh child for every execution, so
+each run skips interpreter start-up but still gets its own process, its own
+resource limits and an empty ``__main__`` namespace. The worker imports a few
+commonly used modules before forking, so children find them already loaded. Where fork is not
+available, every execution starts a new Python interpreter instead and
+passes it the code on stdin. Both run Python in isolated mode (``-I``) and
+UTF-8 mode (``-X utf8``), and output is decoded as UTF-8 in one go.
+
 Safety Features:
 - CPU time limit: 30 seconds
 - Memory limit: 512MB
 - File size limit: 1MB
 - Maximum open files: 10
 - Process timeout: 30 seconds
-- Automatic cleanup of temporary files
+- Automatic cleanup of temporary files at exit
 
 Example:
     ```python
@@ -30,20 +39,81 @@ Example:
     ```
 """
 
+import atexit
+import shutil
 import subprocess
 import os
 import tempfile
 import signal
-from typing import Optional, Tuple
+import json
+import selectors
+import struct
+import threading
+import time
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple
 import sys
 import platform
 
+# Resource limits applied to every execution, keyed by resource name
+_RESOURCE_LIMITS = {
+    'RLIMIT_CPU': 30,                   # CPU time (30 seconds)
+    'RLIMIT_AS': 512 * 1024 * 1024,     # Memory (512MB)
+    'RLIMIT_FSIZE': 1024 * 1024,        # File size (1MB)
+    'RLIMIT_NOFILE': 10,                # Open files
+}
+
+try:
+    import resource
+    # Linux can set limits on another process, so children need no preexec_fn
+    _HAS_PRLIMIT = hasattr(resource, 'prlimit')
+except ImportError:
+    _HAS_PRLIMIT = False
+
+# Modules the warm worker imports up front, so forked children start with them
+# loaded. Kept to the standard library: large packages such as numpy map enough
+# memory to count noticeably against RLIMIT_AS in every child.
+_PRELOAD_MODULES = ('json', 'math', 're', 'statistics')
+
+# Extra time the worker gets to report back before it is considered hung
+_WORKER_GRACE = 5.0
+
+_LENGTH = struct.Struct('>I')
+_RESULT = struct.Struct('>i?II')
+
+
+@lru_cache(maxsize=None)
+def _worker_source() -> str:
+    """Source of the warm sandbox worker, read once per process."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_sandbox_worker.py')
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=None)
+def _shared_temp_dir() -> str:
+    """
+    The sandbox directory shared by every CodeInterpreter in this process.
+
+    Created on first use and removed when the process exits, so building
+    interpreters costs no directory churn and nothing is left behind when
+    an interpreter is never garbage collected.
+    """
+    path = tempfile.mkdtemp(prefix='code_sandbox_')
+    atexit.register(shutil.rmtree, path, ignore_errors=True)
+    return path
+
+
+class _WorkerError(Exception):
+    """The warm worker died or stopped answering."""
+
+
 class CodeInterpreter:
     """
     A sandboxed Python code interpreter with resource limits and safety measures.
     
     This class provides a safe environment for executing Python code by:
-    - Creating isolated temporary directories
+    - Running code in a temporary working directory
     - Setting resource limits on the execution process
     - Implementing timeouts to prevent infinite loops
     - Cleaning up resources automatically
@@ -53,29 +123,45 @@ class CodeInterpreter:
     
     Attributes:
         temp_dir: Path to the temporary directory used for code execution
+        timeout: Wall-clock limit for a single execution, in seconds
+        preload: Modules the warm worker imports before forking children
     """
     
-    def __init__(self):
-        """Initialize a new CodeInterpreter instance."""
+    def __init__(self, timeout: float = 30, preload: Sequence[str] = _PRELOAD_MODULES):
+        """
+        Initialize a new CodeInterpreter instance.
+
+        Args:
+            timeout: Wall-clock limit for a single execution, in seconds.
+            preload: Modules to import once in the warm worker so executed
+                code finds them loaded. Modules that are not installed are
+                skipped. Has no effect where the worker is not used.
+        """
         self.temp_dir = None
+        self.timeout = timeout
+        self.preload = tuple(preload)
+        self._worker: Optional[subprocess.Popen] = None
+        self._use_worker = hasattr(os, 'fork') and platform.system() != 'Windows'
+        self._lock = threading.Lock()
         self._setup_temp_dir()
 
     def _setup_temp_dir(self):
         """
         Set up a temporary directory for code execution.
         
-        Creates a unique temporary directory that will be used to store
-        and execute Python code. The directory is automatically cleaned up
-        when the interpreter is destroyed.
+        Uses the process-wide sandbox directory as the working directory of
+        executed code, for any files it writes. The directory is shared by
+        all interpreters and removed when the process exits.
         """
-        self.temp_dir = tempfile.mkdtemp(prefix='code_sandbox_')
+        self.temp_dir = _shared_temp_dir()
 
-    def _set_resource_limits(self):
+    def _set_resource_limits(self, pid: int = 0):
         """
         Set resource limits for the sandbox.
         
-        This method sets various resource limits on the current process
-        to prevent abuse and ensure safe code execution. Limits include:
+        This method sets various resource limits on the given process, or on
+        the current process when ``pid`` is 0, to prevent abuse and ensure
+        safe code execution. Limits include:
         - CPU time limit (30 seconds)
         - Memory limit (512MB)
         - File size limit (1MB)
@@ -84,19 +170,17 @@ class CodeInterpreter:
         Note:
             Resource limits are only set on Unix-like systems (Linux, macOS).
             On Windows, this method does nothing as the resource module
-            is not available.
+            is not available. Limiting another process needs
+            ``resource.prlimit`` (Linux only).
         """
         if platform.system() != 'Windows':
             try:
                 import resource
-                # Set CPU time limit (30 seconds)
-                resource.setrlimit(resource.RLIMIT_CPU, (30, 30))
-                # Set memory limit (512MB)
-                resource.setrlimit(resource.RLIMIT_AS, (512 * 1024 * 1024, 512 * 1024 * 1024))
-                # Set file size limit (1MB)
-                resource.setrlimit(resource.RLIMIT_FSIZE, (1024 * 1024, 1024 * 1024))
-                # Set maximum number of open files
-                resource.setrlimit(resource.RLIMIT_NOFILE, (10, 10))
+                for name, value in _RESOURCE_LIMITS.items():
+                    if pid:
+                        resource.prlimit(pid, getattr(resource, name), (value, value))
+                    else:
+                        resource.setrlimit(getattr(resource, name), (value, value))
             except ImportError:
                 # Resource module not available, skip setting limits
                 pass
@@ -105,8 +189,9 @@ class CodeInterpreter:
         """Execute Python code in a sandboxed environment.
         
         This method executes the provided Python code in an isolated environment
-        with resource limits and safety measures. The code is written to a
-        temporary file and executed as a separate process.
+        with resource limits and safety measures. The code runs in a separate
+        process: a child forked from the warm worker where possible, otherwise
+        a fresh interpreter that reads the code from stdin.
         
         Args:
             code: Python code to execute as a string.
@@ -119,9 +204,8 @@ class CodeInterpreter:
         Safety Features:
             - Code is executed in a separate process
             - Resource limits are applied (CPU, memory, file size)
-            - Process timeout of 30 seconds
-            - Automatic cleanup of temporary files
-            - Isolated temporary directory
+            - Process timeout of ``timeout`` seconds (30 by default)
+            - Isolated temporary directory as the working directory
         
         Example:
             interpreter = CodeInterpreter()
@@ -132,54 +216,145 @@ class CodeInterpreter:
             This method is designed for educational and development purposes.
             Do not use it to execute untrusted code in production environments.
         """
-        # Create a temporary file for the code
-        script_path = os.path.join(self.temp_dir, 'script.py')
-        with open(script_path, 'w') as f:
-            f.write(code)
+        if self._use_worker:
+            with self._lock:
+                try:
+                    self._ensure_worker()
+                except OSError:
+                    # No warm worker on this system; start an interpreter per run
+                    self._use_worker = False
+                else:
+                    return self._execute_in_worker(code)
+        return self._execute_in_subprocess(code)
 
+    def _ensure_worker(self) -> subprocess.Popen:
+        """Start the warm worker unless one is already running."""
+        if self._worker is None or self._worker.poll() is not None:
+            self._worker = subprocess.Popen(
+                [sys.executable, '-I', '-X', 'utf8', '-c', _worker_source(), json.dumps(_RESOURCE_LIMITS), str(self.timeout),
+                 ','.join(self.preload)],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0,
+                cwd=self.temp_dir
+            )
+        return self._worker
+
+    def _stop_worker(self):
+        """Kill the warm worker, if any; the next execution starts a new one."""
+        worker, self._worker = self._worker, None
+        if worker is not None:
+            try:
+                worker.kill()
+                worker.wait()
+                worker.stdin.close()
+                worker.stdout.close()
+            except Exception:
+                pass
+
+    def _read_from_worker(self, size: int, deadline: float) -> bytes:
+        """Read exactly ``size`` bytes from the worker before ``deadline``."""
+        fd = self._worker.stdout.fileno()
+        data = bytearray()
+        with selectors.DefaultSelector() as selector:
+            selector.register(fd, selectors.EVENT_READ)
+            while len(data) < size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not selector.select(remaining):
+                    raise _WorkerError("sandbox worker stopped responding")
+                chunk = os.read(fd, size - len(data))
+                if not chunk:
+                    raise _WorkerError("sandbox worker exited unexpectedly")
+                data += chunk
+        return bytes(data)
+
+    def _execute_in_worker(self, code: str) -> Tuple[str, Optional[str]]:
+        """Run ``code`` in a child forked from the warm worker."""
+        try:
+            # surrogatepass encodes any str; the worker decodes the same way
+            payload = code.encode('utf-8', 'surrogatepass')
+        except UnicodeError as e:
+            return "", f"Error executing code: {str(e)}"
+        try:
+            self._worker.stdin.write(_LENGTH.pack(len(payload)) + payload)
+            deadline = time.monotonic() + self.timeout + _WORKER_GRACE
+            returncode, timed_out, out_size, err_size = _RESULT.unpack(
+                self._read_from_worker(_RESULT.size, deadline)
+            )
+            output = self._read_from_worker(out_size + err_size, deadline)
+        except (OSError, _WorkerError) as e:
+            self._stop_worker()
+            return "", f"Error executing code: {str(e)}"
+
+        if timed_out:
+            return "", f"Execution timed out after {self.timeout} seconds"
+
+        # Check if the process was killed due to resource limits
+        if returncode == -signal.SIGKILL:
+            return "", "Process killed due to resource limits exceeded"
+
+        stdout = output[:out_size].decode('utf-8', 'replace')
+        stderr = output[out_size:].decode('utf-8', 'replace')
+        return stdout, stderr if stderr else None
+
+    def _execute_in_subprocess(self, code: str) -> Tuple[str, Optional[str]]:
+        """Run ``code`` in a fresh interpreter that reads it from stdin."""
         try:
-            # Set up the process with resource limits
+            # Without preexec_fn subprocess can spawn with vfork instead of
+            # copying this process's page tables with fork. With prlimit the
+            # limits are set right after the spawn; the child only receives
+            # its code once they are in place.
+            limit_after_spawn = _HAS_PRLIMIT or platform.system() == 'Windows'
+
+            # Set up the process with resource limits; isolated mode skips
+            # user site-packages and PYTHON* environment variables. Output is
+            # captured as bytes and decoded once: UTF-8 mode (-X utf8, which
+            # unlike PYTHONUTF8 survives -I) makes the child emit UTF-8
+            # whatever the OS locale.
             process = subprocess.Popen(
-                [sys.executable, script_path],
+                [sys.executable, '-I', '-X', 'utf8', '-'],
+                stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-                preexec_fn=self._set_resource_limits if platform.system() != 'Windows' else None,
+                preexec_fn=None if limit_after_spawn else self._set_resource_limits,
                 cwd=self.temp_dir
             )
+            if _HAS_PRLIMIT:
+                try:
+                    self._set_resource_limits(process.pid)
+                except OSError:
+                    process.kill()
+                    process.communicate()
+                    raise
 
-            # Set a timeout of 30 seconds
+            # Stop the process once the timeout is reached
             try:
-                stdout, stderr = process.communicate(timeout=30)
+                stdout, stderr = process.communicate(
+                    input=code.encode('utf-8', 'surrogatepass'), timeout=self.timeout
+                )
             except subprocess.TimeoutExpired:
                 process.kill()
-                return "", "Execution timed out after 30 seconds"
+                process.communicate()
+                return "", f"Execution timed out after {self.timeout} seconds"
 
             # Check if the process was killed due to resource limits
             if process.returncode == -9:  # SIGKILL
                 return "", "Process killed due to resource limits exceeded"
 
+            stdout = stdout.decode('utf-8', 'replace')
+            stderr = stderr.decode('utf-8', 'replace')
             return stdout, stderr if stderr else None
 
         except Exception as e:
             return "", f"Error executing code: {str(e)}"
-        finally:
-            # Clean up the temporary file
-            try:
-                os.remove(script_path)
-            except:
-                pass
 
     def __del__(self):
         """
         Cleanup when the interpreter is destroyed.
         
-        This method ensures that the temporary directory and all its contents
-        are properly cleaned up when the CodeInterpreter instance is destroyed.
+        This method ensures that the warm worker is stopped when the
+        CodeInterpreter instance is destroyed. The shared temporary directory
+        is removed at process exit.
         """
-        if self.temp_dir and os.path.exists(self.temp_dir):
-            try:
-                import shutil
-                shutil.rmtree(self.temp_dir)
-            except:
-                pass 
\ No newline at end of file
+        self._stop_worker() 
\ No newline at end of file
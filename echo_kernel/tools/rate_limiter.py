@@ -0,0 +1,161 @@
+"""
+Rate Limiter - Token Bucket for Web Tools
+
+This module provides an async token-bucket rate limiter. Unlike a fixed
+delay between requests, a token bucket lets idle callers make a short burst
+of requests immediately while still holding sustained load to a steady rate.
+
+HostRateLimiter keeps one bucket per host, so requests to unrelated sites
+never wait on each other while each site still sees a polite request rate.
+
+Example:
+    ```python
+    bucket = TokenBucket(capacity=5, rate=1.0)
+
+    # The first five calls return at once; after that, one per second
+    await bucket.acquire()
+
+    limiter = HostRateLimiter(capacity=5, rate=1.0)
+    await limiter.for_url("https://example.com/page").acquire()
+    ```
+"""
+
+import asyncio
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """
+    An async-safe token-bucket rate limiter.
+    
+    The bucket holds up to ``capacity`` tokens and refills continuously at
+    ``rate`` tokens per second. Each acquire() takes one token, sleeping only
+    when the bucket is empty. Waiters are served in order through an
+    asyncio.Lock.
+    
+    Attributes:
+        capacity: Maximum number of tokens (the largest burst allowed)
+        rate: Tokens added per second (the sustained request rate)
+        tokens: Tokens currently available
+        last_refill: time.monotonic() reading of the last refill
+    """
+    
+    def __init__(self, capacity: float = 5, rate: float = 1.0):
+        """
+        Initialize a new, full TokenBucket.
+        
+        Args:
+            capacity: Maximum number of tokens (default: 5)
+            rate: Tokens added per second (default: 1.0)
+        """
+        if capacity < 1 or rate <= 0:
+            raise ValueError("capacity must be at least 1 and rate must be positive")
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _refill(self):
+        """Add the tokens earned since the last refill, up to capacity."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Return the lock for the running event loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def drain(self):
+        """
+        Empty the bucket, so the next acquire() waits a full refill interval.
+        
+        Callers use this to back off when the upstream signals congestion.
+        """
+        self._refill()
+        self.tokens = min(self.tokens, 0.0)
+
+    async def acquire(self):
+        """
+        Take one token, waiting for the bucket to refill if it is empty.
+        """
+        async with self._get_lock():
+            self._refill()
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+
+class HostRateLimiter:
+    """
+    A registry of TokenBuckets, one per host.
+    
+    Buckets are created on first use. A bucket left idle for ``idle_timeout``
+    seconds has long since refilled, so it is indistinguishable from a new
+    one and is dropped to keep memory bounded; idle buckets are swept at most
+    once per ``idle_timeout``.
+    
+    Attributes:
+        capacity: Burst size of each host's bucket
+        rate: Sustained requests per second allowed for each host
+        idle_timeout: Seconds after which an unused bucket is discarded
+    """
+    
+    def __init__(self, capacity: float = 5, rate: float = 1.0, idle_timeout: float = 600.0):
+        """
+        Initialize a new HostRateLimiter.
+        
+        Args:
+            capacity: Burst size of each host's bucket (default: 5)
+            rate: Requests per second allowed for each host (default: 1.0)
+            idle_timeout: Seconds after which an unused bucket is discarded (default: 600)
+        """
+        if capacity < 1 or rate <= 0:
+            raise ValueError("capacity must be at least 1 and rate must be positive")
+        self.capacity = capacity
+        self.rate = rate
+        self.idle_timeout = idle_timeout
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._next_sweep = time.monotonic() + idle_timeout
+
+    def _sweep(self, now: float):
+        """Drop the buckets nobody has used for idle_timeout seconds."""
+        idle_since = now - self.idle_timeout
+        for host in [host for host, bucket in self._buckets.items() if bucket.last_refill < idle_since]:
+            del self._buckets[host]
+        self._next_sweep = now + self.idle_timeout
+
+    def for_host(self, host: str) -> TokenBucket:
+        """
+        Return the bucket for ``host``, creating it if needed.
+        
+        Args:
+            host: Host name, or any other key requests should be paced under
+        """
+        now = time.monotonic()
+        if now >= self._next_sweep:
+            self._sweep(now)
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = TokenBucket(self.capacity, self.rate)
+        return bucket
+
+    def for_url(self, url: str) -> TokenBucket:
+        """
+        Return the bucket for the host ``url`` points at.
+        
+        URLs without a host name share a single bucket.
+        """
+        try:
+            host = urlsplit(url).hostname
+        except ValueError:
+            host = None
+        return self.for_host(host or "default")
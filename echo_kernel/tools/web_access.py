@@ -40,14 +40,255 @@ Example:
     ```
 """
 
+import asyncio
+import copy
 import requests
+import threading
 import time
 import re
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from urllib.parse import urlparse, urljoin
 import html
 from bs4 import BeautifulSoup
 import json
+import importlib.util
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+
+try:
+    from echo_kernel.providers.DuckDuckGoSearchProvider import DuckDuckGoSearchProvider
+except ImportError:
+    DuckDuckGoSearchProvider = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+# BeautifulSoup tree builder for full_parse: the C-backed lxml parser when it
+# is installed, the pure-Python html.parser otherwise.
+_SOUP_PARSER = 'lxml' if etree is not None else 'html.parser'
+
+# Schemes get_page_content will fetch.
+_ALLOWED_SCHEMES = frozenset({'http', 'https'})
+
+# Patterns that mark a URL as unsafe wherever they appear in it.
+_DANGEROUS_URL_RE = re.compile(r'file://|ftp://|data:|javascript:|vbscript:|<script', re.IGNORECASE)
+
+# Regex fast path for _extract_text_content. These cover the fields we
+# return without building a DOM; pass full_parse=True to use BeautifulSoup.
+# Like an HTML parser, an unclosed comment, script or style runs to the end
+# of the document, and '<' only opens a tag when a letter, '/', '!' or '?'
+# follows it; otherwise it is text, as in "2 < 4". A title or heading match
+# stops at the next opening tag of its kind (and its start tag at the next
+# '<'), so pages full of unclosed tags are scanned in linear time.
+_DROP_RE = re.compile(r'<!--.*?(?:-->|\Z)|<!DOCTYPE[^>]*>|<(script|style)\b[^>]*>.*?(?:</\1\s*>|\Z)', re.IGNORECASE | re.DOTALL)
+_TITLE_RE = re.compile(r'<title\b[^<>]*>((?:(?!<title\b).)*?)</title\s*>', re.IGNORECASE | re.DOTALL)
+_META_RE = re.compile(r'<meta\b[^>]*>', re.IGNORECASE)
+_ATTR_RE = re.compile(r'([\w:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+))')
+_HEADING_RE = re.compile(r'<(h[1-3])\b[^<>]*>((?:(?!<h[1-3]\b).)*?)</\1\s*>', re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r'<[A-Za-z/!?][^>]*(?:>|\Z)')
+
+# Largest page body get_page_content will download, and the read size used
+# while streaming it.
+_MAX_CONTENT_BYTES = 10 * 1024 * 1024
+_CHUNK_SIZE = 64 * 1024
+
+# word_count splits extracted text this many characters at a time, so a
+# large page never materializes a list of all its words at once.
+_WORD_COUNT_CHUNK = 16 * 1024
+_SPACE_RE = re.compile(r'\s')
+
+
+class _HttpxResponse:
+    """
+    The slice of ``requests.Response`` get_page_content uses, over a
+    streamed ``httpx.Response``.
+    """
+    
+    def __init__(self, response: "httpx.Response"):
+        self._response = response
+        self.status_code = response.status_code
+        self.reason = response.reason_phrase
+        self.headers = response.headers
+    
+    def iter_content(self, chunk_size: int = _CHUNK_SIZE):
+        try:
+            yield from self._response.iter_bytes(chunk_size)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except httpx.HTTPError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+    
+    def close(self):
+        self._response.close()
+
+
+class _HttpxSession:
+    """
+    The slice of ``requests.Session`` get_page_content uses, over one pooled
+    ``httpx.Client`` that speaks HTTP/2 when the h2 package is installed.
+    
+    Requests to the same host share one connection (multiplexed under
+    HTTP/2) instead of one keep-alive connection per concurrent fetch.
+    httpx errors are re-raised as their requests equivalents, so
+    get_page_content handles failures the same way for either session.
+    """
+    
+    def __init__(self, **client_options):
+        self._client = httpx.Client(
+            http2=importlib.util.find_spec('h2') is not None,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            timeout=httpx.Timeout(30, connect=5),
+            **client_options
+        )
+        self.headers = self._client.headers
+    
+    def get(self, url: str, timeout: Optional[float] = None, stream: bool = False,
+            headers: Optional[Dict[str, str]] = None) -> _HttpxResponse:
+        request = self._client.build_request(
+            'GET', url, headers=headers,
+            timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else httpx.Timeout(timeout, connect=min(timeout, 5))
+        )
+        try:
+            response = self._client.send(request, stream=True)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+        except httpx.HTTPError as e:
+            raise requests.exceptions.RequestException(str(e)) from e
+        return _HttpxResponse(response)
+    
+    def close(self):
+        self._client.close()
+
+
+class _TextCollector:
+    """
+    lxml parser target that gathers title, meta description, text and
+    h1-h3 headings in a single pass, without building a document tree.
+    
+    It sees the same events BeautifulSoup's lxml builder does and treats text
+    the same way (strings end at tags and comments; whitespace-only strings
+    collapse outside <pre>/<textarea>), so the results match _parse_with_soup.
+    """
+    
+    _SKIP = frozenset({'script', 'style'})
+    _PRESERVE_WHITESPACE = frozenset({'pre', 'textarea'})
+    _HEADINGS = ('h1', 'h2', 'h3')
+    
+    def __init__(self):
+        self.text: List[str] = []
+        self.title: Optional[List[str]] = None
+        self.description: Optional[str] = None
+        self.headings: Dict[str, List[List[str]]] = {tag: [] for tag in self._HEADINGS}
+        # Buffers of the title/heading elements currently open
+        self._open: List[Tuple[str, List[str]]] = []
+        self._pending: List[str] = []
+        self._skip_depth = 0
+        self._preserve_depth = 0
+    
+    def _flush(self):
+        """End the current string, as BeautifulSoup does at every tag."""
+        if not self._pending:
+            return
+        string = ''.join(self._pending)
+        self._pending.clear()
+        if self._skip_depth:
+            return
+        if not self._preserve_depth and not string.strip():
+            string = '\n' if '\n' in string else ' '
+        self.text.append(string)
+        for _, buffer in self._open:
+            buffer.append(string)
+    
+    def start(self, tag, attrib):
+        self._flush()
+        if tag in self._PRESERVE_WHITESPACE:
+            self._preserve_depth += 1
+        if self._skip_depth or tag in self._SKIP:
+            self._skip_depth += 1
+        elif tag in self.headings:
+            buffer: List[str] = []
+            self.headings[tag].append(buffer)
+            self._open.append((tag, buffer))
+        elif tag == 'title' and self.title is None:
+            self.title = []
+            self._open.append((tag, self.title))
+        elif tag == 'meta' and self.description is None and attrib.get('name') == 'description':
+            self.description = attrib.get('content', '')
+    
+    def end(self, tag):
+        self._flush()
+        if tag in self._PRESERVE_WHITESPACE:
+            self._preserve_depth -= 1
+        if self._skip_depth:
+            self._skip_depth -= 1
+        elif self._open and self._open[-1][0] == tag:
+            self._open.pop()
+    
+    def data(self, data):
+        self._pending.append(data)
+    
+    def comment(self, text):
+        self._flush()
+    
+    def doctype(self, *args):
+        self._flush()
+    
+    def pi(self, *args):
+        self._flush()
+    
+    def close(self):
+        self._flush()
+        return self
+
+
+def _count_words(text: str) -> int:
+    """
+    Count whitespace-separated words, like ``len(text.split())``, splitting
+    the text in chunks that end on whitespace so no word is cut in two.
+    """
+    words = 0
+    start = 0
+    while start < len(text):
+        boundary = _SPACE_RE.search(text, start + _WORD_COUNT_CHUNK)
+        end = boundary.end() if boundary else len(text)
+        words += len(text[start:end].split())
+        start = end
+    return words
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header into seconds from now.
+    
+    Args:
+        value: Header value, either delay-seconds or an HTTP date
+        
+    Returns:
+        Seconds to wait (never negative), or None if absent or unparsable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
 
 class WebAccess:
     """
@@ -65,24 +306,47 @@ class WebAccess:
     educational and development purposes.
     
     Attributes:
-        session: Requests session for maintaining connections
-        last_request_time: Timestamp of the last request for rate limiting
+        session: Pooled HTTP session: an HTTP/2 httpx client when httpx is
+            installed, a requests session otherwise
+        last_request_time: time.monotonic() reading of the last request for rate limiting
         rate_limit_delay: Minimum delay between requests in seconds
         search_provider: Search provider for web search functionality
+        cache_ttl: Seconds a successfully fetched page is served from cache
+        cache_size: Maximum number of pages (and of searches) kept in the cache
+        search_cache_ttl: Seconds a successful search is served from cache
     """
     
-    def __init__(self, rate_limit_delay: float = 1.0, search_provider=None):
+    def __init__(self, rate_limit_delay: float = 1.0, search_provider=None,
+                 cache_ttl: float = 300.0, cache_size: int = 256,
+                 search_cache_ttl: float = 60.0):
         """
         Initialize a new WebAccess instance.
         
         Args:
             rate_limit_delay: Minimum delay between requests in seconds (default: 1.0)
             search_provider: Search provider instance (default: None, will use DuckDuckGo if available)
+            cache_ttl: Seconds a successfully fetched page is served from cache (default: 300)
+            cache_size: Maximum number of pages, and of searches, kept in the
+                cache (default: 256)
+            search_cache_ttl: Seconds a successful search is served from cache (default: 60)
         """
-        self.session = requests.Session()
-        self.last_request_time = 0
+        self.session = _HttpxSession() if httpx is not None else requests.Session()
+        self.last_request_time = float('-inf')
         self.rate_limit_delay = rate_limit_delay
         self.search_provider = search_provider
+        # The DuckDuckGo provider search_web created itself, if any
+        self._fallback_provider = None
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self.search_cache_ttl = search_cache_ttl
+        # (url, full_parse) -> (expiry on the monotonic clock, result, validators).
+        # Validators are the conditional request headers (If-None-Match,
+        # If-Modified-Since) that let an expired page be revalidated.
+        self._page_cache: "OrderedDict[Tuple[str, bool], Tuple[float, Dict[str, Any], Dict[str, str]]]" = OrderedDict()
+        # (provider, query, max_results) -> (expiry on the monotonic clock, result)
+        self._search_cache: "OrderedDict[Tuple[Any, str, int], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # get_page_content runs on executor threads, so guard both caches
+        self._cache_lock = threading.Lock()
         
         # Set up session headers
         self.session.headers.update({
@@ -112,29 +376,102 @@ class WebAccess:
                 return False
                 
             # Only allow HTTP and HTTPS
-            if parsed.scheme not in ['http', 'https']:
+            if parsed.scheme not in _ALLOWED_SCHEMES:
                 return False
                 
             # Check for potentially dangerous patterns
-            dangerous_patterns = [
-                r'file://',
-                r'ftp://',
-                r'data:',
-                r'javascript:',
-                r'vbscript:',
-                r'<script',
-                r'javascript:',
-            ]
-            
-            for pattern in dangerous_patterns:
-                if re.search(pattern, url, re.IGNORECASE):
-                    return False
+            if _DANGEROUS_URL_RE.search(url):
+                return False
                     
             return True
             
         except Exception:
             return False
 
+    def _get_cached_page(self, key: Tuple[str, bool]) -> Tuple[Optional[Dict[str, Any]], Dict[str, str]]:
+        """
+        Look up a page result in the cache.
+        
+        Returns a copy of the result if it is still fresh, otherwise None
+        together with the validators of the expired entry (empty if there is
+        nothing to revalidate).
+        """
+        with self._cache_lock:
+            entry = self._page_cache.get(key)
+            if entry is None:
+                return None, {}
+            expires, result, validators = entry
+            if time.monotonic() >= expires:
+                # Keep expired pages that can still be revalidated with a 304
+                if not validators:
+                    del self._page_cache[key]
+                return None, validators
+            self._page_cache.move_to_end(key)
+        return {**result, 'headings': list(result['headings'])}, {}
+
+    def _cache_page(self, key: Tuple[str, bool], result: Dict[str, Any],
+                    validators: Optional[Dict[str, str]] = None):
+        """
+        Store a successful page result, evicting the least recently used
+        entry once the cache is full.
+        """
+        if self.cache_ttl <= 0 or self.cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._page_cache[key] = (time.monotonic() + self.cache_ttl, result, validators or {})
+            self._page_cache.move_to_end(key)
+            while len(self._page_cache) > self.cache_size:
+                self._page_cache.popitem(last=False)
+
+    def _revalidated_page(self, key: Tuple[str, bool]) -> Optional[Dict[str, Any]]:
+        """
+        Renew a cached page after the server answered 304 Not Modified.
+        """
+        with self._cache_lock:
+            entry = self._page_cache.get(key)
+            if entry is None:
+                return None
+        _, result, validators = entry
+        self._cache_page(key, result, validators)
+        return {**result, 'headings': list(result['headings'])}
+
+    def _get_cached_search(self, key: Tuple[Any, str, int]) -> Optional[Dict[str, Any]]:
+        """
+        Return a copy of a cached search result, or None if missing or expired.
+        """
+        with self._cache_lock:
+            entry = self._search_cache.get(key)
+            if entry is None:
+                return None
+            expires, result = entry
+            if time.monotonic() >= expires:
+                del self._search_cache[key]
+                return None
+            self._search_cache.move_to_end(key)
+        return copy.deepcopy(result)
+
+    def _cache_search(self, key: Tuple[Any, str, int], result: Dict[str, Any]):
+        """
+        Store a successful search result, evicting the least recently used
+        entry once the cache is full.
+        """
+        if self.search_cache_ttl <= 0 or self.cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._search_cache[key] = (time.monotonic() + self.search_cache_ttl, copy.deepcopy(result))
+            self._search_cache.move_to_end(key)
+            while len(self._search_cache) > self.cache_size:
+                self._search_cache.popitem(last=False)
+
+    def _rate_limit_wait(self) -> float:
+        """
+        Return how long to wait before the next request may be made.
+        
+        Elapsed time is measured with time.monotonic(), which is not affected
+        by system clock adjustments.
+        """
+        return self.rate_limit_delay - (time.monotonic() - self.last_request_time)
+
     def _rate_limit(self):
         """
         Implement rate limiting between requests.
@@ -142,64 +479,53 @@ class WebAccess:
         This method ensures that requests are not made too frequently
         to be respectful to web servers and avoid being blocked.
         """
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        if time_since_last < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - time_since_last
+        sleep_time = self._rate_limit_wait()
+        if sleep_time > 0:
             time.sleep(sleep_time)
             
-        self.last_request_time = time.time()
+        self.last_request_time = time.monotonic()
+
+    async def _arate_limit(self):
+        """
+        Async variant of _rate_limit that yields to the event loop while waiting.
+        """
+        sleep_time = self._rate_limit_wait()
+        if sleep_time > 0:
+            await asyncio.sleep(sleep_time)
+            
+        self.last_request_time = time.monotonic()
 
-    def _extract_text_content(self, html_content: str) -> Dict[str, Any]:
+    def _extract_text_content(self, html_content: str, full_parse: bool = False) -> Dict[str, Any]:
         """
         Extract and clean text content from HTML.
         
         Args:
             html_content: Raw HTML content
+            full_parse: Parse the page with a real HTML parser instead of the
+                regex fast path (default: False): a single lxml pass when
+                lxml is installed, BeautifulSoup otherwise
             
         Returns:
             Dictionary containing extracted content
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-                
-            # Get title
-            title = ""
-            title_tag = soup.find('title')
-            if title_tag:
-                title = title_tag.get_text().strip()
-                
-            # Get main text content
-            text = soup.get_text()
-            
-            # Clean up whitespace
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text = ' '.join(chunk for chunk in chunks if chunk)
+            if full_parse and _SOUP_PARSER == 'lxml':
+                title, description, text, headings = self._parse_with_lxml(html_content)
+            elif full_parse:
+                title, description, text, headings = self._parse_with_soup(html_content)
+            else:
+                title, description, text, headings = self._parse_with_regex(html_content)
             
-            # Get meta description
-            description = ""
-            meta_desc = soup.find('meta', attrs={'name': 'description'})
-            if meta_desc:
-                description = meta_desc.get('content', '').strip()
-                
-            # Get main headings
-            headings = []
-            for tag in ['h1', 'h2', 'h3']:
-                for heading in soup.find_all(tag):
-                    headings.append(heading.get_text().strip())
+            # Clean up whitespace: phrases end at line breaks and double
+            # spaces, so turn the latter into the former and split once
+            text = ' '.join(filter(None, map(str.strip, text.replace('  ', '\n').splitlines())))
                     
             return {
                 'title': title,
                 'description': description,
                 'text': text,
                 'headings': headings,
-                'word_count': len(text.split())
+                'word_count': _count_words(text)
             }
             
         except Exception as e:
@@ -211,17 +537,113 @@ class WebAccess:
                 'word_count': 0
             }
 
-    def get_page_content(self, url: str, timeout: int = 30) -> Dict[str, Any]:
+    @staticmethod
+    def _parse_with_regex(html_content: str) -> Tuple[str, str, str, List[str]]:
+        """
+        Pull title, meta description, raw text and h1-h3 headings out of HTML
+        with precompiled regexes. Results match _parse_with_soup for
+        well-formed pages.
+        """
+        html_content = _DROP_RE.sub('', html_content)
+        
+        # Get title
+        title = ""
+        title_match = _TITLE_RE.search(html_content)
+        if title_match:
+            title = html.unescape(_TAG_RE.sub('', title_match.group(1))).strip()
+            
+        # Get meta description
+        description = ""
+        for meta_tag in _META_RE.finditer(html_content):
+            attrs = {
+                key.lower(): double or single or bare
+                for key, double, single, bare in _ATTR_RE.findall(meta_tag.group(0))
+            }
+            if attrs.get('name') == 'description':
+                description = html.unescape(attrs.get('content', '')).strip()
+                break
+                
+        # Get main headings, grouped by level like the BeautifulSoup path
+        headings = [
+            html.unescape(_TAG_RE.sub('', inner)).strip()
+            for level in ('h1', 'h2', 'h3')
+            for tag, inner in _HEADING_RE.findall(html_content)
+            if tag.lower() == level
+        ]
+        
+        text = html.unescape(_TAG_RE.sub('', html_content))
+        return title, description, text, headings
+
+    @staticmethod
+    def _parse_with_lxml(html_content: str) -> Tuple[str, str, str, List[str]]:
+        """
+        Pull title, meta description, raw text and h1-h3 headings out of HTML
+        in one lxml parser pass. Results match _parse_with_soup.
+        """
+        parser = etree.HTMLParser(target=_TextCollector(), recover=True)
+        parser.feed(html_content)
+        collected = parser.close()
+        
+        title = ''.join(collected.title or ()).strip()
+        description = (collected.description or '').strip()
+        headings = [
+            ''.join(buffer).strip()
+            for tag in _TextCollector._HEADINGS
+            for buffer in collected.headings[tag]
+        ]
+        return title, description, ''.join(collected.text), headings
+
+    @staticmethod
+    def _parse_with_soup(html_content: str) -> Tuple[str, str, str, List[str]]:
+        """
+        Pull title, meta description, raw text and h1-h3 headings out of HTML
+        with BeautifulSoup.
+        """
+        soup = BeautifulSoup(html_content, _SOUP_PARSER)
+        
+        # Remove script and style elements
+        for script in soup(["script", "style"]):
+            script.decompose()
+            
+        # Get title
+        title = ""
+        title_tag = soup.find('title')
+        if title_tag:
+            title = title_tag.get_text().strip()
+            
+        # Get main text content
+        text = soup.get_text()
+        
+        # Get meta description
+        description = ""
+        meta_desc = soup.find('meta', attrs={'name': 'description'})
+        if meta_desc:
+            description = meta_desc.get('content', '').strip()
+            
+        # Get main headings
+        headings = []
+        for tag in ['h1', 'h2', 'h3']:
+            for heading in soup.find_all(tag):
+                headings.append(heading.get_text().strip())
+                
+        return title, description, text, headings
+
+    def get_page_content(self, url: str, timeout: int = 30, full_parse: bool = False) -> Dict[str, Any]:
         """
         Retrieve and parse web page content.
         
         This method fetches web page content with proper error handling,
         rate limiting, and content extraction. It returns structured data
-        including the page title, text content, and metadata.
+        including the page title, text content, and metadata. Successful
+        results are cached for cache_ttl seconds; failures are not cached.
+        Once a cached page expires it is revalidated with its ETag or
+        Last-Modified date, and a 304 answer reuses the cached result.
         
         Args:
             url: URL of the web page to retrieve
             timeout: Request timeout in seconds (default: 30)
+            full_parse: Extract content with BeautifulSoup instead of the
+                regex fast path (default: False)
             
         Returns:
             Dictionary containing page content and metadata:
@@ -234,7 +656,8 @@ class WebAccess:
                 'text': str,
                 'headings': list,
                 'word_count': int,
-                'error': str (if request failed)
+                'error': str (if request failed),
+                'retry_after': float (if the server sent Retry-After)
             }
             
         Safety Features:
@@ -262,48 +685,83 @@ class WebAccess:
                 'error': 'Invalid or unsafe URL provided'
             }
             
+        # Serve repeated GETs from the cache without touching the network
+        cache_key = (url, full_parse)
+        cached, validators = self._get_cached_page(cache_key)
+        if cached is not None:
+            return cached
+            
         # Implement rate limiting
         self._rate_limit()
         
         try:
-            # Make the request
-            response = self.session.get(url, timeout=timeout, stream=True)
+            # Make the request, conditional if an expired copy can be revalidated
+            response = self.session.get(url, timeout=timeout, stream=True, headers=validators or None)
+            
+            if response.status_code == 304 and validators:
+                response.close()
+                revalidated = self._revalidated_page(cache_key)
+                if revalidated is not None:
+                    return revalidated
+                # Evicted in the meantime: fetch the page unconditionally
+                response = self.session.get(url, timeout=timeout, stream=True)
+            
+            too_large = {
+                'success': False,
+                'url': url,
+                'status_code': response.status_code,
+                'error': 'Content too large (exceeds 10MB limit)'
+            }
             
             # Check if response is too large (limit to 10MB)
             content_length = response.headers.get('content-length')
-            if content_length and int(content_length) > 10 * 1024 * 1024:
+            if content_length and int(content_length) > _MAX_CONTENT_BYTES:
                 response.close()
-                return {
-                    'success': False,
-                    'url': url,
-                    'status_code': response.status_code,
-                    'error': 'Content too large (exceeds 10MB limit)'
-                }
-                
-            # Read content
-            content = response.content.decode('utf-8', errors='ignore')
+                return too_large
             
-            # Check status code
+            # Check status code before downloading the body
             if response.status_code != 200:
                 response.close()
-                return {
+                error_result = {
                     'success': False,
                     'url': url,
                     'status_code': response.status_code,
                     'error': f'HTTP {response.status_code}: {response.reason}'
                 }
+                retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+                if retry_after is not None:
+                    error_result['retry_after'] = retry_after
+                return error_result
             
+            # Read content in chunks, stopping as soon as it passes the limit,
+            # since Content-Length may be missing or wrong
+            chunks = []
+            size = 0
+            for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+                size += len(chunk)
+                if size > _MAX_CONTENT_BYTES:
+                    response.close()
+                    return too_large
+                chunks.append(chunk)
             response.close()
+            content = b''.join(chunks).decode('utf-8', errors='ignore')
             
             # Extract text content
-            extracted_content = self._extract_text_content(content)
+            extracted_content = self._extract_text_content(content, full_parse)
             
-            return {
+            result = {
                 'success': True,
                 'url': url,
                 'status_code': response.status_code,
                 **extracted_content
             }
+            validators = {}
+            if response.headers.get('ETag'):
+                validators['If-None-Match'] = response.headers['ETag']
+            if response.headers.get('Last-Modified'):
+                validators['If-Modified-Since'] = response.headers['Last-Modified']
+            self._cache_page(cache_key, result, validators)
+            return {**result, 'headings': list(result['headings'])}
             
         except requests.exceptions.Timeout:
             return {
@@ -334,36 +792,54 @@ class WebAccess:
                 'error': f'Unexpected error: {str(e)}'
             }
 
-    async def search_web(self, query: str, max_results: int = 5) -> Dict[str, Any]:
+    async def search_web(self, query: str, max_results: int = 5, session=None) -> Dict[str, Any]:
         """
         Perform a web search using the configured search provider.
         
         This method uses the search provider to perform web searches. If no
         provider is configured, it will attempt to use DuckDuckGo as a fallback.
+        Successful searches are cached for search_cache_ttl seconds per
+        provider, query and max_results; failures are not cached.
         
         Args:
             query: Search query string
             max_results: Maximum number of results to return
+            session: Optional aiohttp session for the DuckDuckGo fallback to
+                reuse instead of opening one per search. Providers passed to
+                the constructor keep their own sessions.
             
         Returns:
             Dictionary containing search results or error information
         """
         # If no search provider is configured, try to use DuckDuckGo as fallback
         if self.search_provider is None:
-            try:
-                from echo_kernel.providers.DuckDuckGoSearchProvider import DuckDuckGoSearchProvider
-                self.search_provider = DuckDuckGoSearchProvider()
-            except ImportError:
+            if DuckDuckGoSearchProvider is None:
                 return {
                     'success': False,
                     'query': query,
                     'error': 'No search provider configured and DuckDuckGo provider not available',
                     'suggestion': 'Install aiohttp and configure a search provider'
                 }
+            # Searches are already paced by _arate_limit below; the provider's
+            # own delay would only block the event loop a second time.
+            self.search_provider = self._fallback_provider = DuckDuckGoSearchProvider(rate_limit_delay=0)
+        
+        if session is not None and self.search_provider is self._fallback_provider:
+            self._fallback_provider.session = session
+        
+        cache_key = (self.search_provider, query, max_results)
+        cached = self._get_cached_search(cache_key)
+        if cached is not None:
+            return cached
+        
+        await self._arate_limit()
         
         # Use the configured search provider
         try:
-            return await self.search_provider.search(query, max_results)
+            result = await self.search_provider.search(query, max_results)
+            if result.get('success'):
+                self._cache_search(cache_key, result)
+            return result
         except Exception as e:
             return {
                 'success': False,
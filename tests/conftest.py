@@ -4,53 +4,47 @@ Pytest configuration and common fixtures for EchoKernel tests.
 
 import pytest
 import asyncio
-from unittest.mock import Mock, AsyncMock
-from typing import Dict, Any
+from pathlib import Path
+
+import aiohttp
 
 from echo_kernel.EchoKernel import EchoKernel
-from echo_kernel.ITextProvider import ITextProvider
-from echo_kernel.IEmbeddingProvider import IEmbeddingProvider
-from echo_kernel.IStorageProvider import IStorageProvider
-from echo_kernel.ITextMemory import ITextMemory
+from tests.fakes import (
+    FakeAiohttpSession,
+    FakeEmbeddingProvider,
+    FakeMemoryProvider,
+    FakeStorageProvider,
+    FakeTextProvider,
+)
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; fall back to the default asyncio loop
+    uvloop = None
 
 
 @pytest.fixture
 def mock_text_provider():
-    """Create a mock text provider for testing."""
-    provider = Mock(spec=ITextProvider)
-    provider.generate_text = AsyncMock(return_value="Mock response")
-    provider.generate_text_with_tools = AsyncMock(return_value="Mock tool response")
-    return provider
+    """Create a fake text provider for testing."""
+    return FakeTextProvider(native_tools=True)
 
 
 @pytest.fixture
 def mock_embedding_provider():
-    """Create a mock embedding provider for testing."""
-    provider = Mock(spec=IEmbeddingProvider)
-    provider.generate_embedding = AsyncMock(return_value=[0.1, 0.2, 0.3])
-    return provider
+    """Create a fake embedding provider for testing."""
+    return FakeEmbeddingProvider()
 
 
 @pytest.fixture
 def mock_storage_provider():
-    """Create a mock storage provider for testing."""
-    provider = Mock(spec=IStorageProvider)
-    provider.add_text = AsyncMock()
-    provider.search_similar = AsyncMock(return_value=[])
-    provider.get_text = AsyncMock(return_value=None)
-    provider.delete_text = AsyncMock()
-    return provider
+    """Create a fake storage provider for testing."""
+    return FakeStorageProvider()
 
 
 @pytest.fixture
 def mock_memory_provider():
-    """Create a mock memory provider for testing."""
-    provider = Mock(spec=ITextMemory)
-    provider.add_text = AsyncMock()
-    provider.search_similar = AsyncMock(return_value=[])
-    provider.get_text = AsyncMock(return_value=None)
-    provider.delete_text = AsyncMock()
-    return provider
+    """Create a fake memory provider for testing."""
+    return FakeMemoryProvider()
 
 
 @pytest.fixture
@@ -105,13 +99,45 @@ def sample_search_results():
     ]
 
 
+if uvloop is not None:
+    @pytest.fixture(scope="session")
+    def event_loop_policy():
+        """Run pytest-asyncio tests on uvloop when it is installed."""
+        return uvloop.EventLoopPolicy()
+
+
+# Canned HTTP responses
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture(scope="session")
+def read_fixture():
+    """Return a loader for the canned response files in tests/fixtures."""
+    def _read(name: str) -> str:
+        return (FIXTURES_DIR / name).read_text(encoding="utf-8")
+    return _read
+
+
 @pytest.fixture
-def event_loop():
-    """Create an event loop for async tests."""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    yield loop
-    loop.close()
+def mock_aiohttp(monkeypatch):
+    """Route every ``aiohttp.ClientSession`` through one FakeAiohttpSession."""
+    session = FakeAiohttpSession()
+    monkeypatch.setattr(aiohttp, "ClientSession", lambda *args, **kwargs: session)
+    return session
+
+
+@pytest.fixture(scope="session")
+async def http_session():
+    """One real aiohttp session shared by all live-network tests."""
+    async with aiohttp.ClientSession() as session:
+        yield session
+
+
+@pytest.fixture
+def duckduckgo_api(mock_aiohttp, read_fixture):
+    """Answer every DuckDuckGo Instant Answer API request with a canned result."""
+    mock_aiohttp.add(r"^https://api\.duckduckgo\.com/", read_fixture("duckduckgo_search.json"))
+    return mock_aiohttp
 
 
 # Pytest configuration
@@ -126,6 +152,16 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "unit: marks tests as unit tests"
     )
+    config.addinivalue_line(
+        "markers", "network: marks tests that need live internet access (deselected by default)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Let tests marked 'network' through pytest-socket's --disable-socket."""
+    for item in items:
+        if item.get_closest_marker("network"):
+            item.add_marker(pytest.mark.enable_socket)
 
 
 # Async test utilities
@@ -133,10 +169,13 @@ class AsyncTestCase:
     """Base class for async test cases."""
     
     @pytest.fixture(autouse=True)
-    def setup_event_loop(self, event_loop):
+    def setup_event_loop(self):
         """Set up event loop for async tests."""
-        self.loop = event_loop
+        self.loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
         asyncio.set_event_loop(self.loop)
+        yield
+        asyncio.set_event_loop(None)
+        self.loop.close()
     
     def run_async(self, coro):
         """Run an async coroutine in the test event loop."""
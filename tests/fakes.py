@@ -0,0 +1,218 @@
+"""
+Hand-rolled fakes for EchoKernel provider interfaces and aiohttp sessions.
+
+These are much cheaper to build and call than ``Mock(spec=...)``/``AsyncMock``
+and expose only the interface methods, plus just enough of the Mock API
+(``return_value``, ``side_effect``, ``call_count``, ``assert_called_*``) for
+the tests that inspect them.
+"""
+
+import inspect
+import json
+import re
+from collections import deque
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+import aiohttp
+
+
+class FakeAsyncMethod:
+    """
+    A lightweight stand-in for ``AsyncMock``.
+
+    Records every call and answers with queued ``responses`` (first in, first
+    out). Once the queue is empty it calls ``side_effect`` if one is set,
+    awaiting the result when needed, and otherwise returns ``default``.
+    """
+
+    def __init__(self, name: str, default: Any = None, provider_calls: Optional[List] = None):
+        self.name = name
+        self.default = default
+        self._initial_default = default
+        self.side_effect: Optional[Callable] = None
+        self.responses: Deque[Any] = deque()
+        self.calls: List[Tuple[tuple, dict]] = []
+        self._provider_calls = provider_calls
+
+    async def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if self._provider_calls is not None:
+            self._provider_calls.append((self.name, args, kwargs))
+        if self.responses:
+            return self.responses.popleft()
+        if self.side_effect is not None:
+            result = self.side_effect(*args, **kwargs)
+            return await result if inspect.isawaitable(result) else result
+        return self.default
+
+    @property
+    def return_value(self) -> Any:
+        return self.default
+
+    @return_value.setter
+    def return_value(self, value: Any) -> None:
+        self.default = value
+
+    @property
+    def call_count(self) -> int:
+        return len(self.calls)
+
+    @property
+    def call_args(self) -> Optional[Tuple[tuple, dict]]:
+        return self.calls[-1] if self.calls else None
+
+    def reset(self) -> None:
+        """Forget recorded calls and queued responses, and restore the initial default and side_effect."""
+        self.calls.clear()
+        self.responses.clear()
+        self.default = self._initial_default
+        self.side_effect = None
+
+    def assert_called(self) -> None:
+        assert self.calls, f"Expected '{self.name}' to have been called."
+
+    def assert_called_once(self) -> None:
+        assert len(self.calls) == 1, f"Expected '{self.name}' to have been called once. Called {len(self.calls)} times."
+
+    def assert_called_once_with(self, *args, **kwargs) -> None:
+        self.assert_called_once()
+        assert self.calls[0] == (args, kwargs), f"Expected call: {(args, kwargs)!r}. Actual call: {self.calls[0]!r}"
+
+
+class FakeAsyncProvider:
+    """
+    A minimal fake provider exposing only the async methods it is built with.
+
+    Each keyword argument names a method and its default return value, so the
+    fake satisfies exactly the provider protocols those methods make up.
+    All calls are also recorded, in order, in ``calls``.
+
+    Example:
+        provider = FakeAsyncProvider(generate_text="Mock response")
+        provider.generate_text.responses.extend(["first", "second"])
+    """
+
+    def __init__(self, **defaults: Any):
+        self.calls: List[Tuple[str, tuple, dict]] = []
+        self._methods: List[FakeAsyncMethod] = []
+        for name, default in defaults.items():
+            method = FakeAsyncMethod(name, default, self.calls)
+            self._methods.append(method)
+            setattr(self, name, method)
+
+    def reset(self) -> None:
+        """Forget all recorded calls and queued responses, and restore every method's initial answers."""
+        self.calls.clear()
+        for method in self._methods:
+            method.reset()
+
+
+class FakeTextProvider(FakeAsyncProvider):
+    """
+    Fake ITextProvider.
+
+    ``generate_text`` answers ``tool_response`` when it is given a non-empty
+    ``tools`` list and its ``default`` otherwise. With ``native_tools=True``
+    the fake also has a ``generate_text_with_tools`` method, which the kernel
+    prefers over passing tools to ``generate_text``.
+    """
+
+    tool_response = "Mock tool response"
+
+    def __init__(self, native_tools: bool = False):
+        methods = {"generate_text": "Mock response"}
+        if native_tools:
+            methods["generate_text_with_tools"] = self.tool_response
+        super().__init__(**methods)
+        self.generate_text.side_effect = self._generate_text
+
+    def reset(self) -> None:
+        super().reset()
+        self.generate_text.side_effect = self._generate_text
+
+    def _generate_text(self, prompt, system_prompt=None, tools=None, **kwargs):
+        return self.tool_response if tools else self.generate_text.default
+
+
+class FakeEmbeddingProvider(FakeAsyncProvider):
+    """Fake IEmbeddingProvider returning a fixed three-dimensional embedding."""
+
+    def __init__(self):
+        super().__init__(generate_embedding=[0.1, 0.2, 0.3])
+
+
+class FakeMemoryProvider(FakeAsyncProvider):
+    """Fake ITextMemory that stores nothing and finds nothing."""
+
+    def __init__(self):
+        super().__init__(add_text=None, search_similar=[], get_text=None, delete_text=None)
+
+
+class FakeStorageProvider(FakeAsyncProvider):
+    """Fake IStorageProvider that stores nothing and finds nothing."""
+
+    def __init__(self):
+        super().__init__(
+            initialize=None,
+            add_vector=None,
+            search_vectors=[],
+            get_vector=None,
+            delete_vector=None,
+        )
+
+
+class FakeAiohttpResponse:
+    """Canned stand-in for ``aiohttp.ClientResponse``."""
+
+    def __init__(self, status: int = 200, body: str = "", reason: str = "OK"):
+        self.status = status
+        self.reason = reason
+        self._body = body
+
+    async def json(self, **kwargs):
+        return json.loads(self._body)
+
+    async def text(self, **kwargs):
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeAiohttpSession:
+    """
+    Stand-in for ``aiohttp.ClientSession`` that answers from registered routes.
+
+    Routes are matched by regex against the request URL, most recent first.
+    Unmatched requests fail like a refused connection.
+    """
+
+    def __init__(self):
+        self.routes: List[Tuple["re.Pattern", FakeAiohttpResponse]] = []
+        self.requests: List[Tuple[str, str, dict]] = []
+        self.closed = False
+
+    def add(self, pattern: str, body: str = "", status: int = 200, reason: str = "OK") -> None:
+        self.routes.insert(0, (re.compile(pattern), FakeAiohttpResponse(status, body, reason)))
+
+    def _request(self, method: str, url: str, **kwargs) -> FakeAiohttpResponse:
+        self.requests.append((method, url, kwargs))
+        for pattern, response in self.routes:
+            if pattern.search(url):
+                return response
+        raise aiohttp.ClientConnectionError(f"Connection refused: {method} {url}")
+
+    def get(self, url: str, **kwargs) -> FakeAiohttpResponse:
+        return self._request("GET", url, **kwargs)
+
+    async def close(self) -> None:
+        self.closed = True
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
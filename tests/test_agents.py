@@ -13,7 +13,9 @@ from echo_kernel.agents.TaskDecomposerAgent import TaskDecomposerAgent
 from echo_kernel.agents.LoopAgent import LoopAgent
 from echo_kernel.agents.RouterAgent import RouterAgent
 from echo_kernel.agents.SpecialistRouterAgent import SpecialistRouterAgent
-from echo_kernel.agents.MemoryAgent import MemoryAgent
+from echo_kernel.agents.MemoryAgent import MemoryAgent, _top_k_by_score
+from echo_kernel.providers.VectorMemoryProvider import VectorMemoryProvider
+from tests.fakes import FakeEmbeddingProvider
 
 
 class TestEchoAgent:
@@ -87,7 +89,7 @@ class TestTaskDecomposerAgent:
         decomposer = TaskDecomposerAgent("Decomposer", echo_kernel, executor)
         
         # Mock the response to simulate task decomposition
-        mock_text_provider.generate_text.return_value = "1. Step one\n2. Step two\n3. Step three"
+        mock_text_provider.generate_text.default = "1. Step one\n2. Step two\n3. Step three"
         
         subtasks = await decomposer.decompose_task("Complex task")
         
@@ -115,11 +117,11 @@ class TestTaskDecomposerAgent:
         decomposer = TaskDecomposerAgent("Decomposer", echo_kernel, executor)
         
         # Mock decomposition and execution
-        mock_text_provider.generate_text.side_effect = [
+        mock_text_provider.generate_text.responses.extend([
             "1. Step one\n2. Step two",
             "Result 1",
             "Result 2"
-        ]
+        ])
         
         result = await decomposer.coordinate_execution("Complex task")
         
@@ -150,11 +152,11 @@ class TestLoopAgent:
             return "final" in result.lower()
         
         # Mock responses that eventually meet stop condition
-        mock_text_provider.generate_text.side_effect = [
+        mock_text_provider.generate_text.responses.extend([
             "First iteration",
             "Second iteration",
             "Final result"
-        ]
+        ])
         
         result = await agent.iterate("Initial task", stop_condition)
         
@@ -170,13 +172,29 @@ class TestLoopAgent:
         def stop_condition(result: str) -> bool:
             return False  # Never stop
         
-        mock_text_provider.generate_text.return_value = "Iteration result"
+        mock_text_provider.generate_text.default = "Iteration result"
         
         result = await agent.iterate("Initial task", stop_condition)
         
         assert result == "Iteration result"
         assert agent.iteration_count == 2
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("memoize, expected_calls", [(True, 2), (False, 4)])
+    async def test_loop_agent_memoizes_repeated_prompt(self, echo_kernel, mock_text_provider,
+                                                        memoize, expected_calls):
+        """Test LoopAgent skips the provider when the next prompt repeats the last one."""
+        echo_kernel.register_provider(mock_text_provider)
+        agent = LoopAgent("LoopAgent", echo_kernel, max_iterations=4, memoize=memoize)
+
+        mock_text_provider.generate_text.default = "Same answer"
+
+        result = await agent.iterate("Initial task", stop_condition=lambda r: False)
+
+        assert result == "Same answer"
+        assert agent.iteration_count == 4
+        assert mock_text_provider.generate_text.call_count == expected_calls
+
     @pytest.mark.unit
     def test_loop_agent_reset(self, echo_kernel):
         """Test LoopAgent reset functionality."""
@@ -215,7 +233,7 @@ class TestRouterAgent:
         router = RouterAgent("Router", echo_kernel, specialists)
         
         # Mock routing decision
-        mock_text_provider.generate_text.return_value = "coding"
+        mock_text_provider.generate_text.default = "coding"
         
         result = await router.route_task("Write a Python function")
         
@@ -233,7 +251,7 @@ class TestRouterAgent:
         router = RouterAgent("Router", echo_kernel, specialists)
         
         # Mock invalid routing decision
-        mock_text_provider.generate_text.return_value = "invalid_specialist"
+        mock_text_provider.generate_text.default = "invalid_specialist"
         
         result = await router.route_task("Some task")
         
@@ -272,10 +290,10 @@ class TestSpecialistRouterAgent:
             return "valid" in result.lower()
         
         # Mock responses
-        mock_text_provider.generate_text.side_effect = [
+        mock_text_provider.generate_text.responses.extend([
             "coding",  # Routing decision
             "valid result"  # Specialist response
-        ]
+        ])
         
         result = await router.route_with_validation("Task", validator)
         
@@ -303,17 +321,67 @@ class TestSpecialistRouterAgent:
             call_count["count"] += 1
             return False  # Always fail validation
 
-        mock_text_provider.generate_text.side_effect = [
+        mock_text_provider.generate_text.responses.extend([
             "coding",  # First routing decision
             "writing",  # Second routing decision
             "coding",   # Third routing decision (if needed)
             "writing",  # Fourth routing decision (if needed)
-        ]
+        ])
 
         with pytest.raises(ValueError, match="Failed to route task after 2 attempts"):
             await router.route_with_validation("Task", validator=validator)
         assert call_count["count"] == 2
 
+    @pytest.mark.asyncio
+    async def test_specialist_router_prefers_better_ranked_of_simultaneous_results(self, echo_kernel, mock_text_provider):
+        """Test that when several candidates finish together, the best-ranked valid one wins."""
+        echo_kernel.register_provider(mock_text_provider)
+        names = [f"specialist{i}" for i in range(8)]
+        specialists = {name: EchoAgent(name, echo_kernel) for name in names}
+        for name, agent in specialists.items():
+            async def run(*args, _name=name, **kwargs):
+                return f"valid from {_name}"
+            agent.run = run
+
+        router = SpecialistRouterAgent("SpecialistRouter", echo_kernel, specialists)
+        for ranking in (names, names[::-1], names[3:] + names[:3]):
+            mock_text_provider.generate_text.default = ", ".join(ranking)
+
+            result = await router.route_with_validation("Task", validator=lambda r: "valid" in r)
+
+            assert result == f"valid from {ranking[0]}"
+
+    @pytest.mark.asyncio
+    async def test_specialist_router_cancels_slower_candidates(self, echo_kernel, mock_text_provider):
+        """Test that ranked candidates run concurrently and losers are cancelled."""
+        echo_kernel.register_provider(mock_text_provider)
+        specialists = {
+            "coding": EchoAgent("Coder", echo_kernel),
+            "writing": EchoAgent("Writer", echo_kernel)
+        }
+        slow_tasks = []
+
+        async def fast_run(*args, **kwargs):
+            return "valid result"
+
+        async def slow_run(*args, **kwargs):
+            slow_tasks.append(asyncio.current_task())
+            await asyncio.sleep(10)
+            return "valid but slow"
+
+        specialists["coding"].run = fast_run
+        specialists["writing"].run = slow_run
+
+        router = SpecialistRouterAgent("SpecialistRouter", echo_kernel, specialists)
+        mock_text_provider.generate_text.default = "writing, coding"
+
+        result = await router.route_with_validation("Task", validator=lambda r: "valid" in r)
+
+        assert result == "valid result"
+        assert mock_text_provider.generate_text.call_count == 1
+        assert len(slow_tasks) == 1
+        assert slow_tasks[0].cancelled()
+
 
 class TestMemoryAgent:
     """Test cases for MemoryAgent class."""
@@ -371,6 +439,92 @@ class TestMemoryAgent:
         assert results == sample_search_results
         mock_memory_provider.search_similar.assert_called_once_with("Query")
 
+    @pytest.mark.asyncio
+    async def test_memory_agent_min_score_filter(self, echo_kernel, mock_text_provider, mock_memory_provider, sample_search_results):
+        """Test that low-scoring memories are left out of the prompt."""
+        echo_kernel.register_provider(mock_text_provider)
+        echo_kernel.register_provider(mock_memory_provider)
+        agent = MemoryAgent("MemoryAgent", echo_kernel, min_score=0.8)
+
+        mock_memory_provider.search_similar.return_value = sample_search_results
+
+        await agent.process_with_memory("New message")
+
+        prompt = mock_text_provider.generate_text.call_args[0][0]
+        assert "Result 1" in prompt
+        assert "Result 2" in prompt
+        assert "Result 3" not in prompt
+
+    @pytest.mark.asyncio
+    async def test_memory_agent_topk_selection(self, echo_kernel, mock_text_provider, mock_memory_provider):
+        """Test that only the top-scoring memories are used, best first."""
+        import random
+
+        echo_kernel.register_provider(mock_text_provider)
+        echo_kernel.register_provider(mock_memory_provider)
+        agent = MemoryAgent("MemoryAgent", echo_kernel, context_size=5)
+
+        results = [{"text": f"Memory {i}", "score": i / 100} for i in range(100)]
+        random.Random(0).shuffle(results)
+        mock_memory_provider.search_similar.return_value = results
+
+        await agent.process_with_memory("New message")
+
+        prompt = mock_text_provider.generate_text.call_args[0][0]
+        context_lines = [line for line in prompt.splitlines() if line.startswith("- ")]
+        assert context_lines == [f"- Memory {i}" for i in (99, 98, 97, 96, 95)]
+
+    @pytest.fixture
+    def vector_memory(self):
+        """A VectorMemoryProvider over the FAISS store, with one axis-aligned embedding per text."""
+        embeddings = FakeEmbeddingProvider()
+        axes = {"apples are red": [1.0, 0.0, 0.0], "bananas are yellow": [0.0, 1.0, 0.0], "cherries are dark": [0.0, 0.0, 1.0]}
+        embeddings.generate_embedding.side_effect = lambda text: axes.get(text, [0.9, 0.3, 0.0])
+        return VectorMemoryProvider(embeddings)
+
+    @pytest.mark.asyncio
+    async def test_memory_agent_min_score_with_vector_memory(self, echo_kernel, mock_text_provider, vector_memory):
+        """Test that min_score filters on the similarity a real memory provider reports."""
+        for text in ("apples are red", "bananas are yellow", "cherries are dark"):
+            await vector_memory.add_text(text)
+        echo_kernel.register_provider(mock_text_provider)
+        agent = MemoryAgent("MemoryAgent", echo_kernel, memory_interface=vector_memory, min_score=0.5)
+
+        await agent.process_with_memory("what colour is fruit?")
+        await agent.flush()
+
+        prompt = mock_text_provider.generate_text.call_args[0][0]
+        assert "- apples are red" in prompt
+        assert "bananas" not in prompt and "cherries" not in prompt
+
+    @pytest.mark.asyncio
+    async def test_top_k_orders_vector_memory_results(self, vector_memory):
+        """Test that top-k selection ranks real search results by their similarity."""
+        import random
+
+        for text in ("apples are red", "bananas are yellow", "cherries are dark"):
+            await vector_memory.add_text(text)
+        results = await vector_memory.search_similar("what colour is fruit?", limit=3)
+        ranked = [r["text"] for r in results]
+        random.Random(1).shuffle(results)
+
+        assert [r["text"] for r in _top_k_by_score(results, 2)] == ranked[:2]
+
+    @pytest.mark.unit
+    def test_jit_predicate_falls_back_without_numba(self, monkeypatch):
+        """Test that jit_predicate returns the plain function when numba is missing."""
+        import sys
+        import numpy as np
+        from echo_kernel._jit import jit_predicate
+
+        monkeypatch.setitem(sys.modules, "numba", None)
+
+        def above(scores, threshold):
+            return scores >= threshold
+
+        assert jit_predicate(above) is above
+        assert above(np.array([0.2, 0.9]), 0.5).tolist() == [False, True]
+
     @pytest.mark.asyncio
     async def test_memory_agent_conversation_context(self, echo_kernel, mock_text_provider, mock_memory_provider):
         """Test MemoryAgent conversation context management."""
@@ -385,10 +539,58 @@ class TestMemoryAgent:
         await agent.process_with_memory("First message")
         await agent.process_with_memory("Second message")
         await agent.process_with_memory("Third message")
+        await agent.flush()
         
         # Should have added each message to memory
         assert mock_memory_provider.add_text.call_count == 3
 
+    @pytest.mark.asyncio
+    async def test_memory_agent_write_does_not_block_reply(self, echo_kernel, mock_text_provider, mock_memory_provider):
+        """Test MemoryAgent returns before the memory write finishes and flush waits for it."""
+        echo_kernel.register_provider(mock_text_provider)
+        echo_kernel.register_provider(mock_memory_provider)
+        agent = MemoryAgent("MemoryAgent", echo_kernel)
+
+        mock_memory_provider.search_similar.return_value = []
+        release = asyncio.Event()
+        stored = []
+
+        async def slow_add_text(text, metadata):
+            await release.wait()
+            stored.append(text)
+
+        mock_memory_provider.add_text.side_effect = slow_add_text
+
+        result = await agent.process_with_memory("New message")
+
+        assert result == "Mock response"
+        assert stored == []
+
+        release.set()
+        await agent.flush()
+
+        assert stored == ["New message"]
+
+    @pytest.mark.asyncio
+    async def test_memory_agent_flush_raises_failed_write(self, echo_kernel, mock_text_provider, mock_memory_provider):
+        """Test that a background memory write that fails is raised from flush, once."""
+        echo_kernel.register_provider(mock_text_provider)
+        echo_kernel.register_provider(mock_memory_provider)
+        agent = MemoryAgent("MemoryAgent", echo_kernel)
+
+        mock_memory_provider.search_similar.return_value = []
+        async def failing_add_text(text, metadata):
+            raise RuntimeError("memory store down")
+
+        mock_memory_provider.add_text.side_effect = failing_add_text
+
+        assert await agent.process_with_memory("Lost message") == "Mock response"
+        await asyncio.sleep(0.01)  # let the write fail before flush is called
+
+        with pytest.raises(RuntimeError, match="memory store down"):
+            await agent.flush()
+        await agent.flush()
+
 
 class TestAgentIntegration:
     """Integration tests for agent interactions."""
@@ -405,13 +607,13 @@ class TestAgentIntegration:
         router = RouterAgent("Router", echo_kernel, {"decompose": decomposer, "loop": loop_agent})
 
         # Mock responses
-        mock_text_provider.generate_text.side_effect = [
+        mock_text_provider.generate_text.responses.extend([
             "decompose",  # Router decision
             "1. Step one\n2. Step two",  # Decomposition
             "Result 1",  # Step one result
             "Result 2",  # Step two result
             "Final result"  # Coordination result
-        ]
+        ])
 
         result = await router.route_task("Complex task")
 
@@ -429,10 +631,10 @@ class TestAgentIntegration:
         router = SpecialistRouterAgent("Router", echo_kernel, specialists)
         
         # Mock responses
-        mock_text_provider.generate_text.side_effect = [
+        mock_text_provider.generate_text.responses.extend([
             "memory",  # Routing decision
             "Response with context"  # Memory agent response
-        ]
+        ])
         mock_memory_provider.search_similar.return_value = []
         
         def validator(result: str) -> bool:
@@ -0,0 +1,287 @@
+"""
+Tests for Code Interpreter Tool
+
+This module contains tests for the sandboxed code execution tool and the
+JSON result it returns to the model.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from echo_kernel.tools import _sandbox_worker
+from echo_kernel.tools.code_interpreter import CodeInterpreter
+from echo_kernel.tools.CodeInterpreterTool import (
+    _get_interpreter,
+    _loads,
+    code_interpreter_tools,
+    execute_python_code,
+    pretty_result,
+)
+
+
+class TestExecutePythonCode:
+    """Test cases for the execute_python_code tool."""
+
+    @pytest.mark.integration
+    def test_successful_execution(self):
+        """Test that stdout is returned and success is reported."""
+        result = _loads(execute_python_code("print(6 * 7)"))
+
+        assert result == {"stdout": "42\n", "stderr": None, "success": True}
+
+    @pytest.mark.integration
+    def test_failed_execution(self):
+        """Test that a raised exception is reported through stderr."""
+        result = _loads(execute_python_code("raise ValueError('boom')"))
+
+        assert result["success"] is False
+        assert "ValueError: boom" in result["stderr"]
+
+    @pytest.mark.integration
+    def test_whitespace_only_stderr_is_success(self):
+        """Test that stray whitespace on stderr does not mark the run as failed."""
+        result = _loads(execute_python_code("import sys; sys.stderr.write('\\n')"))
+
+        assert result["stderr"] == "\n"
+        assert result["success"] is True
+
+    @pytest.mark.integration
+    def test_result_layout(self):
+        """Test that results are compact, and pretty_result indents them for people."""
+        output = execute_python_code("print('hi')")
+        pretty = pretty_result(output)
+
+        assert "\n" not in output.replace("\\n", "")
+        assert "\n  " in pretty
+        assert _loads(pretty) == _loads(output)
+
+    def test_schema_only_exposes_code(self):
+        """Test that the model-facing tool takes nothing but the code."""
+        tool, = code_interpreter_tools()
+
+        assert list(tool.parameters) == ["code"]
+
+    @pytest.mark.integration
+    @pytest.mark.parametrize("block_orjson", [False, True])
+    def test_non_ascii_output_is_not_escaped(self, block_orjson):
+        """Test that both JSON backends keep non-ASCII text readable."""
+        probe = (
+            "import sys; sys.argv[1] == 'True' and sys.modules.update(orjson=None); "
+            "from echo_kernel.tools.CodeInterpreterTool import _dumps; "
+            "sys.stdout.buffer.write(_dumps({'stdout': 'caf\\u00e9'}).encode())"
+        )
+        output = subprocess.run([sys.executable, "-c", probe, str(block_orjson)], capture_output=True, check=True)
+
+        assert output.stdout.decode() == '{"stdout":"café"}'
+
+    def test_interpreter_is_reused(self):
+        """Test that every call runs through the same interpreter instance."""
+        assert _get_interpreter() is _get_interpreter()
+
+    def test_tool_is_built_once(self):
+        """Test that code_interpreter_tools hands out one shared EchoTool."""
+        first, = code_interpreter_tools()
+        second, = code_interpreter_tools()
+
+        assert first is second
+        assert first.func is execute_python_code
+
+    def test_setup_failure_is_reported_in_stderr(self, tmp_path):
+        """Test that failing to start the sandbox process is reported, not raised."""
+        interpreter = CodeInterpreter()
+        sandbox_dir, interpreter.temp_dir = interpreter.temp_dir, str(tmp_path / "missing")
+        try:
+            stdout, stderr = interpreter.execute_code("print(1)")
+        finally:
+            interpreter.temp_dir = sandbox_dir
+
+        assert stdout == ""
+        assert stderr.startswith("Error executing code:")
+
+    def test_interpreters_share_one_temp_dir(self):
+        """Test that interpreters reuse the process-wide sandbox directory and leave it in place."""
+        first = CodeInterpreter()
+        temp_dir = first.temp_dir
+        second = CodeInterpreter()
+        del first
+
+        assert second.temp_dir == temp_dir
+        assert os.path.isdir(temp_dir)
+
+    @pytest.mark.integration
+    def test_sandbox_module_is_imported_lazily(self):
+        """Test that importing the tool does not import the sandbox module."""
+        probe = (
+            "import sys, echo_kernel.tools.CodeInterpreterTool; "
+            "print('echo_kernel.tools.code_interpreter' in sys.modules)"
+        )
+        output = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+
+        assert output.stdout.strip() == "False"
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(sys.platform == "win32", reason="the warm worker needs fork")
+class TestWarmWorker:
+    """Test cases for executions routed through the warm sandbox worker."""
+
+    @pytest.fixture
+    def interpreter(self):
+        interpreter = CodeInterpreter(timeout=2)
+        yield interpreter
+        interpreter._stop_worker()
+
+    def test_worker_is_reused(self, interpreter):
+        """Test that consecutive executions share one worker process."""
+        interpreter.execute_code("pass")
+        worker = interpreter._worker
+        stdout, stderr = interpreter.execute_code("print('again')")
+
+        assert (stdout, stderr) == ("again\n", None)
+        assert interpreter._worker is worker
+
+    def test_state_does_not_leak_between_runs(self, interpreter):
+        """Test that every execution starts from an empty __main__ namespace."""
+        interpreter.execute_code("import json; leaked = 1")
+        stdout, stderr = interpreter.execute_code("print(__name__); print('leaked' in globals(), 'json' in globals())")
+
+        assert stdout == "__main__\nFalse False\n"
+        assert stderr is None
+
+    @pytest.mark.parametrize("code, expected", [
+        ("import sys; sys.exit('bye')", "bye\n"),
+        ("input()", "EOFError"),
+        ("def broken(:", "SyntaxError"),
+    ])
+    def test_errors_are_reported_in_stderr(self, interpreter, code, expected):
+        """Test that exits, stdin reads and syntax errors come back on stderr."""
+        stdout, stderr = interpreter.execute_code(code)
+
+        assert stdout == ""
+        assert expected in stderr
+        assert "_sandbox_worker" not in stderr
+
+    def test_runs_cannot_see_earlier_code(self, interpreter):
+        """Test that the worker's compile cache does not reach the forked children."""
+        interpreter.execute_code("token = 'API_KEY=abc123'")
+        code = (
+            "import sys; cache = sys._getframe(1).f_globals['_CODE_CACHE']; "
+            "print(len(cache), any('API_KEY=abc123' in c.co_consts for c in cache.values()))"
+        )
+
+        assert interpreter.execute_code(code) == ("0 False\n", None)
+
+    def test_timeout_keeps_worker(self, interpreter):
+        """Test that a runaway execution is stopped without losing the worker."""
+        interpreter.execute_code("pass")
+        worker = interpreter._worker
+
+        assert interpreter.execute_code("while True: pass") == ("", "Execution timed out after 2 seconds")
+        assert interpreter.execute_code("print('ok')") == ("ok\n", None)
+        assert interpreter._worker is worker
+
+    def test_subprocess_fallback(self, interpreter):
+        """Test the per-run interpreter used where the warm worker is unavailable."""
+        interpreter._use_worker = False
+
+        assert interpreter.execute_code("print('cold')") == ("cold\n", None)
+        assert "ZeroDivisionError" in interpreter.execute_code("1 / 0")[1]
+        assert interpreter.execute_code("while True: pass") == ("", "Execution timed out after 2 seconds")
+        assert os.listdir(interpreter.temp_dir) == []
+        assert interpreter._worker is None
+
+    @pytest.mark.parametrize("use_worker", [True, False])
+    def test_resource_limits_are_applied(self, interpreter, use_worker):
+        """Test that executed code runs under the sandbox limits on both paths."""
+        interpreter._use_worker = use_worker
+        code = (
+            "import resource; "
+            "print(resource.getrlimit(resource.RLIMIT_CPU), resource.getrlimit(resource.RLIMIT_NOFILE))"
+        )
+
+        assert interpreter.execute_code(code) == ("(30, 30) (10, 10)\n", None)
+
+    @pytest.mark.parametrize("use_worker", [True, False])
+    def test_output_is_decoded_as_utf8(self, interpreter, use_worker):
+        """Test that output is UTF-8 on both paths and undecodable bytes are replaced."""
+        interpreter._use_worker = use_worker
+        code = "import sys; print('caf\\u00e9 \\u2713', sys.flags.utf8_mode); sys.stdout.flush(); sys.stdout.buffer.write(b'\\xff\\n')"
+
+        assert interpreter.execute_code(code) == ("café ✓ 1\n\ufffd\n", None)
+
+    @pytest.mark.parametrize("use_worker", [True, False])
+    def test_code_runs_in_a_main_module(self, interpreter, use_worker):
+        """Test that names defined by the code can be looked up on __main__, as pickle does."""
+        interpreter._use_worker = use_worker
+        code = "import pickle\ndef f(): return 'ok'\nprint(pickle.loads(pickle.dumps(f))())"
+
+        assert interpreter.execute_code(code) == ("ok\n", None)
+
+    @pytest.mark.parametrize("use_worker", [True, False])
+    @pytest.mark.parametrize("surrogate", ["\ud800", "\udc80"])
+    def test_lone_surrogates_are_reported(self, interpreter, use_worker, surrogate):
+        """Test that code containing lone surrogates fails cleanly without losing the worker."""
+        interpreter._use_worker = use_worker
+        interpreter.execute_code("pass")
+        worker = interpreter._worker
+
+        stdout, stderr = interpreter.execute_code(f"print('{surrogate}')")
+
+        assert stdout == ""
+        assert stderr
+        assert interpreter.execute_code("print('ok')") == ("ok\n", None)
+        assert interpreter._worker is worker
+
+    def test_dead_worker_is_replaced(self, interpreter):
+        """Test that the next execution starts a new worker if the old one died."""
+        interpreter.execute_code("pass")
+        interpreter._worker.kill()
+        interpreter._worker.wait()
+
+        assert interpreter.execute_code("print('ok')") == ("ok\n", None)
+
+    def test_preloaded_modules_are_inherited(self, interpreter):
+        """Test that children start with the preload modules already imported."""
+        stdout, stderr = interpreter.execute_code("import sys; print('statistics' in sys.modules)")
+
+        assert (stdout, stderr) == ("True\n", None)
+
+    def test_missing_preload_module_is_skipped(self):
+        """Test that a preload entry that cannot be imported does not stop the worker."""
+        interpreter = CodeInterpreter(timeout=2, preload=("no_such_module_xyz", "decimal"))
+        try:
+            stdout, stderr = interpreter.execute_code("import sys; print('decimal' in sys.modules)")
+        finally:
+            interpreter._stop_worker()
+
+        assert (stdout, stderr) == ("True\n", None)
+
+
+class TestCompileCache:
+    """Test cases for the worker's compiled-code cache."""
+
+    @pytest.fixture(autouse=True)
+    def _empty_cache(self):
+        _sandbox_worker._CODE_CACHE.clear()
+        yield
+        _sandbox_worker._CODE_CACHE.clear()
+
+    def test_identical_source_reuses_code_object(self):
+        """Test that re-submitted source is not compiled again."""
+        first = _sandbox_worker._compile("print(1)")
+
+        assert _sandbox_worker._compile("print(1)") is first
+        assert _sandbox_worker._compile("print(2)") is not first
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the cache keeps only the most recently used blocks."""
+        compiled = [_sandbox_worker._compile(f"x = {i}") for i in range(_sandbox_worker._CODE_CACHE_SIZE)]
+        _sandbox_worker._compile("x = 0")  # refresh the oldest entry
+        _sandbox_worker._compile("x = 'new'")
+
+        assert len(_sandbox_worker._CODE_CACHE) == _sandbox_worker._CODE_CACHE_SIZE
+        assert _sandbox_worker._compile("x = 0") is compiled[0]
+        assert _sandbox_worker._compile("x = 1") is not compiled[1]
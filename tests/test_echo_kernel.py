@@ -1,9 +1,14 @@
 """
 Unit tests for EchoKernel core functionality.
+
+PYTEST_DONT_REWRITE: assertions here are plain equality checks; the ones
+whose failure needs context carry an explicit message.
 """
 
 import pytest
 import asyncio
+import functools
+import re
 from unittest.mock import Mock, AsyncMock, patch
 from typing import Dict, Any
 
@@ -14,50 +19,84 @@ from echo_kernel.ITextProvider import ITextProvider
 from echo_kernel.IEmbeddingProvider import IEmbeddingProvider
 from echo_kernel.IStorageProvider import IStorageProvider
 from echo_kernel.agents.MemoryAgent import MemoryAgent
+from tests.fakes import FakeEmbeddingProvider, FakeStorageProvider, FakeTextProvider
 
 
-@pytest.fixture
+# The providers below hold no per-test state, so they are built once
+# per session; _reset_session_fakes clears their call history and restores
+# their return_value/side_effect between tests.
+@pytest.fixture(scope="session")
 def mock_text_provider():
-    mock = Mock(spec=ITextProvider)
-    # Return 'Mock tool response' only if tools is a non-empty list
-    async def generate_text_with_tools(prompt, system_prompt=None, tools=None, **kwargs):
-        if tools and len(tools) > 0:
-            return "Mock tool response"
-        return "Mock response"
-    mock.generate_text.side_effect = generate_text_with_tools
-    return mock
-
-@pytest.fixture
+    return FakeTextProvider()
+
+@pytest.fixture(scope="session")
 def mock_embedding_provider():
-    mock = Mock(spec=IEmbeddingProvider)
-    mock.generate_embedding.return_value = [0.1, 0.2, 0.3]
-    return mock
+    return FakeEmbeddingProvider()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_storage_provider():
-    mock = Mock(spec=IStorageProvider)
-    mock.get_vector_store = Mock(return_value=AsyncMock())
-    return mock
-
-@pytest.fixture
+    return FakeStorageProvider()
+
+@pytest.fixture(autouse=True)
+def _reset_session_fakes(mock_text_provider, mock_embedding_provider, mock_storage_provider):
+    mock_text_provider.reset()
+    mock_embedding_provider.reset()
+    mock_storage_provider.reset()
+
+# Compiled once for the pytest.raises(match=...) checks below
+_NO_TEXT = re.compile("No text providers registered")
+_NO_EMBEDDING = re.compile("No embedding providers registered")
+_NO_MEMORY = re.compile("No memory providers registered")
+
+def _sample_tool_function(text: str) -> str:
+    return f"Processed: {text}"
+
+async def _sample_async_tool_function(text: str) -> str:
+    return f"Processed async: {text}"
+
+# Built once at import; register_tool stores references and every test
+# starts from an empty kernel, so sharing them is safe.
+SAMPLE_TOOL = EchoToolClass(
+    name="sample_tool",
+    func=_sample_tool_function,
+    description="A sample tool.",
+)
+SAMPLE_ASYNC_TOOL = EchoToolClass(
+    name="sample_async_tool",
+    func=_sample_async_tool_function,
+    description="A sample async tool.",
+)
+
+@pytest.fixture(scope="session")
 def sample_tool():
-    def sample_tool_function(text: str) -> str:
-        return f"Processed: {text}"
-    return EchoToolClass(
-        name="sample_tool",
-        func=sample_tool_function,
-        description="A sample tool.",
-    )
+    return SAMPLE_TOOL
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_async_tool():
-    async def sample_async_tool_function(text: str) -> str:
-        return f"Processed async: {text}"
-    return EchoToolClass(
-        name="sample_async_tool",
-        func=sample_async_tool_function,
-        description="A sample async tool.",
-    )
+    return SAMPLE_ASYNC_TOOL
+
+# One kernel per test class; _reset_kernel empties it before every test.
+@pytest.fixture(scope="class")
+def echo_kernel():
+    kernel = EchoKernel()
+    yield kernel
+    kernel.clear_providers()
+    kernel.clear_tools()
+
+@pytest.fixture(autouse=True)
+def _reset_kernel(echo_kernel):
+    echo_kernel.clear_providers()
+    echo_kernel.clear_tools()
+
+
+@functools.lru_cache(maxsize=None)
+def _build_sample_tool():
+    """Decorate the sample tool once per session."""
+    @EchoTool(description="Test tool")
+    def test_tool(text: str) -> str:
+        return f"Processed: {text}"
+    return test_tool
+
 
 class TestEchoKernel:
     """Test cases for EchoKernel class."""
@@ -66,59 +105,89 @@ class TestEchoKernel:
     def test_kernel_initialization(self, mock_storage_provider):
         kernel = EchoKernel(storage_provider=mock_storage_provider)
         assert isinstance(kernel, EchoKernel)
-        assert kernel.storage_provider is not None
+        assert isinstance(mock_storage_provider, IStorageProvider)
+        assert kernel.storage_provider is mock_storage_provider
         assert len(kernel.tools) == 0
 
     @pytest.mark.unit
-    def test_register_tool(self, sample_tool):
-        kernel = EchoKernel()
-        kernel.register_tool(sample_tool)
-        assert len(kernel.tools) == 1
-        assert kernel.get_tool("sample_tool") == sample_tool
+    def test_register_tool(self, echo_kernel, sample_tool):
+        echo_kernel.register_tool(sample_tool)
+        assert len(echo_kernel.tools) == 1
+        assert echo_kernel.get_tool("sample_tool") == sample_tool
 
     @pytest.mark.asyncio
     async def test_generate_text_with_provider(self, mock_text_provider):
         kernel = EchoKernel(text_provider=mock_text_provider)
         result = await kernel.generate_text("Test prompt")
-        assert result == "Mock response"
-        mock_text_provider.generate_text.assert_called_once()
+        assert result == "Mock response", f"unexpected result {result!r}"
+        assert len(mock_text_provider.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_session_fakes_are_restored_by_reset(self, mock_text_provider):
+        """Test that reset undoes a test's return_value and side_effect on a session-scoped fake."""
+        mock_text_provider.generate_text.return_value = "Changed"
+        mock_text_provider.generate_text.side_effect = lambda *args, **kwargs: "Side effect"
+
+        mock_text_provider.reset()
+
+        kernel = EchoKernel(text_provider=mock_text_provider)
+        assert await kernel.generate_text("Test prompt") == "Mock response"
+        assert await kernel.generate_text("Test prompt", tools=[SAMPLE_TOOL]) == mock_text_provider.tool_response
 
     @pytest.mark.asyncio
     async def test_generate_embedding_with_provider(self, mock_embedding_provider):
         kernel = EchoKernel(embedding_provider=mock_embedding_provider)
         result = await kernel.generate_embedding("Test text")
-        assert result == [0.1, 0.2, 0.3]
-        mock_embedding_provider.generate_embedding.assert_called_once()
+        assert result == [0.1, 0.2, 0.3], f"unexpected result {result!r}"
+        assert len(mock_embedding_provider.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_generate_text_uses_only_provider_interface(self):
+        # Mock(spec=...) rejects any attribute outside ITextProvider, so this
+        # fails if the kernel starts relying on more than the interface.
+        provider = Mock(spec=ITextProvider)
+        provider.generate_text = AsyncMock(return_value="Spec response")
+        kernel = EchoKernel(text_provider=provider)
+        result = await kernel.generate_text("Test prompt")
+        assert result == "Spec response", f"unexpected result {result!r}"
+        provider.generate_text.assert_awaited_once()
 
     @pytest.mark.unit
-    def test_get_tool_definitions(self, sample_tool):
-        kernel = EchoKernel()
-        kernel.register_tool(sample_tool)
-        descriptions = kernel.get_tool_definitions()
+    def test_get_tool_definitions(self, echo_kernel, sample_tool):
+        echo_kernel.register_tool(sample_tool)
+        descriptions = echo_kernel.get_tool_definitions()
         assert len(descriptions) == 1
         assert descriptions[0]["name"] == "sample_tool"
 
     @pytest.mark.asyncio
-    async def test_execute_tool(self, sample_tool):
-        kernel = EchoKernel()
-        kernel.register_tool(sample_tool)
-        result = await kernel.execute_tool("sample_tool", text="hello")
-        assert result == "Processed: hello"
+    async def test_execute_tool(self, echo_kernel, sample_tool):
+        echo_kernel.register_tool(sample_tool)
+        result = await echo_kernel.execute_tool("sample_tool", text="hello")
+        assert result == "Processed: hello", f"unexpected result {result!r}"
 
     @pytest.mark.asyncio
-    async def test_execute_async_tool(self, sample_async_tool):
-        kernel = EchoKernel()
-        kernel.register_tool(sample_async_tool)
-        result = await kernel.execute_tool("sample_async_tool", text="hello")
-        assert result == "Processed async: hello"
+    async def test_execute_async_tool(self, echo_kernel, sample_async_tool):
+        echo_kernel.register_tool(sample_async_tool)
+        result = await echo_kernel.execute_tool("sample_async_tool", text="hello")
+        assert result == "Processed async: hello", f"unexpected result {result!r}"
+
+    @pytest.mark.asyncio
+    async def test_execute_decorated_async_tool(self, echo_kernel):
+        @EchoTool(description="Shout the text")
+        async def shout(text: str) -> str:
+            return text.upper()
+
+        echo_kernel.register_tool(shout)
+        assert echo_kernel.get_tool("shout").is_async
+        result = await echo_kernel.execute_tool("shout", text="hello")
+        assert result == "HELLO", f"unexpected result {result!r}"
 
     @pytest.mark.unit
-    def test_clear_tools(self, sample_tool):
-        kernel = EchoKernel()
-        kernel.register_tool(sample_tool)
-        assert len(kernel.tools) == 1
-        kernel.clear_tools()
-        assert len(kernel.tools) == 0
+    def test_clear_tools(self, echo_kernel, sample_tool):
+        echo_kernel.register_tool(sample_tool)
+        assert len(echo_kernel.tools) == 1
+        echo_kernel.clear_tools()
+        assert len(echo_kernel.tools) == 0
 
     @pytest.mark.unit
     def test_echo_kernel_initialization(self):
@@ -136,41 +205,25 @@ class TestEchoKernel:
         assert isinstance(kernel.tools, list)
 
     @pytest.mark.unit
-    def test_register_text_provider(self, echo_kernel, mock_text_provider):
-        """Test registering a text provider."""
-        initial_count = len(echo_kernel.text_providers)
-        
-        echo_kernel.register_provider(mock_text_provider)
-        
-        assert len(echo_kernel.text_providers) == initial_count + 1
-        assert mock_text_provider in echo_kernel.text_providers
-
-    @pytest.mark.unit
-    def test_register_embedding_provider(self, echo_kernel, mock_embedding_provider):
-        """Test registering an embedding provider."""
-        initial_count = len(echo_kernel.embedding_providers)
-        
-        echo_kernel.register_provider(mock_embedding_provider)
-        
-        assert len(echo_kernel.embedding_providers) == initial_count + 1
-        assert mock_embedding_provider in echo_kernel.embedding_providers
-
-    @pytest.mark.unit
-    def test_register_memory_provider(self, echo_kernel, mock_memory_provider):
-        """Test registering a memory provider."""
-        initial_count = len(echo_kernel.memory_providers)
+    @pytest.mark.parametrize("provider_fixture, attr", [
+        ("mock_text_provider", "text_providers"),
+        ("mock_embedding_provider", "embedding_providers"),
+        ("mock_memory_provider", "memory_providers"),
+    ])
+    def test_register_provider(self, request, echo_kernel, provider_fixture, attr):
+        """Test registering text, embedding and memory providers."""
+        provider = request.getfixturevalue(provider_fixture)
+        initial_count = len(getattr(echo_kernel, attr))
         
-        echo_kernel.register_provider(mock_memory_provider)
+        echo_kernel.register_provider(provider)
         
-        assert len(echo_kernel.memory_providers) == initial_count + 1
-        assert mock_memory_provider in echo_kernel.memory_providers
+        assert len(getattr(echo_kernel, attr)) == initial_count + 1
+        assert provider in getattr(echo_kernel, attr)
 
     @pytest.mark.unit
     def test_register_tool_with_decorator(self, echo_kernel):
         """Test registering a tool using the EchoTool decorator."""
-        @EchoTool(description="Test tool")
-        def test_tool(text: str) -> str:
-            return f"Processed: {text}"
+        test_tool = _build_sample_tool()
         
         initial_count = len(echo_kernel.tools)
         echo_kernel.register_tool(test_tool)
@@ -180,10 +233,17 @@ class TestEchoKernel:
         assert echo_kernel.get_tool("test_tool") is not None
 
     @pytest.mark.asyncio
-    async def test_generate_text_without_provider(self, echo_kernel):
-        """Test text generation without any registered providers."""
-        with pytest.raises(ValueError, match="No text providers registered"):
-            await echo_kernel.generate_text("Test prompt")
+    @pytest.mark.parametrize("method_name, args, error_pattern", [
+        ("generate_text", ("Test prompt",), _NO_TEXT),
+        ("generate_text_with_tools", ("Test prompt",), _NO_TEXT),
+        ("generate_embedding", ("Test text",), _NO_EMBEDDING),
+        ("add_text_to_memory", ("Test text", {"source": "test"}), _NO_MEMORY),
+        ("search_memory", ("Test query",), _NO_MEMORY),
+    ])
+    async def test_method_without_provider(self, echo_kernel, method_name, args, error_pattern):
+        """Test that provider-backed methods fail clearly when nothing is registered."""
+        with pytest.raises(ValueError, match=error_pattern):
+            await getattr(echo_kernel, method_name)(*args)
 
     @pytest.mark.asyncio
     async def test_generate_text_with_tools(self, echo_kernel, mock_text_provider, sample_tool):
@@ -193,22 +253,10 @@ class TestEchoKernel:
 
         result = await echo_kernel.generate_text_with_tools("Test prompt")
 
-        assert result == "Mock tool response"
+        assert result == "Mock tool response", f"unexpected result {result!r}"
         # Check that generate_text was called with tools
         assert mock_text_provider.generate_text.call_args[1]["tools"] is not None
 
-    @pytest.mark.asyncio
-    async def test_generate_text_with_tools_without_provider(self, echo_kernel):
-        """Test text generation with tools without any registered providers."""
-        with pytest.raises(ValueError, match="No text providers registered"):
-            await echo_kernel.generate_text_with_tools("Test prompt")
-
-    @pytest.mark.asyncio
-    async def test_generate_embedding_without_provider(self, echo_kernel):
-        """Test embedding generation without any registered providers."""
-        with pytest.raises(ValueError, match="No embedding providers registered"):
-            await echo_kernel.generate_embedding("Test text")
-
     @pytest.mark.asyncio
     async def test_add_text_to_memory(self, echo_kernel, mock_memory_provider):
         """Test adding text to memory."""
@@ -218,12 +266,6 @@ class TestEchoKernel:
         
         mock_memory_provider.add_text.assert_called_once_with("Test text", {"source": "test"})
 
-    @pytest.mark.asyncio
-    async def test_add_text_to_memory_without_provider(self, echo_kernel):
-        """Test adding text to memory without any registered providers."""
-        with pytest.raises(ValueError, match="No memory providers registered"):
-            await echo_kernel.add_text_to_memory("Test text", {"source": "test"})
-
     @pytest.mark.asyncio
     async def test_search_memory(self, echo_kernel, mock_memory_provider, sample_search_results):
         """Test searching memory."""
@@ -232,15 +274,9 @@ class TestEchoKernel:
         
         result = await echo_kernel.search_memory("Test query")
         
-        assert result == sample_search_results
+        assert result == sample_search_results, f"{result!r} != {sample_search_results!r}"
         mock_memory_provider.search_similar.assert_called_once_with("Test query")
 
-    @pytest.mark.asyncio
-    async def test_search_memory_without_provider(self, echo_kernel):
-        """Test searching memory without any registered providers."""
-        with pytest.raises(ValueError, match="No memory providers registered"):
-            await echo_kernel.search_memory("Test query")
-
     @pytest.mark.unit
     def test_get_provider_by_type(self, echo_kernel, mock_text_provider, mock_embedding_provider):
         """Test getting providers by type."""
@@ -255,6 +291,44 @@ class TestEchoKernel:
         assert text_providers[0] == mock_text_provider
         assert embedding_providers[0] == mock_embedding_provider
 
+    @pytest.mark.unit
+    def test_get_provider_by_type_multiple_interfaces(self, echo_kernel):
+        """Test that a provider implementing several interfaces is indexed under each."""
+        class TextAndEmbeddingProvider:
+            async def generate_text(self, prompt, **kwargs):
+                return "text"
+
+            async def generate_embedding(self, text):
+                return [0.1]
+
+        provider = TextAndEmbeddingProvider()
+        echo_kernel.register_provider(provider)
+
+        assert echo_kernel.get_providers_by_type(ITextProvider) == [provider]
+        assert echo_kernel.get_providers_by_type(IEmbeddingProvider) == [provider]
+        assert echo_kernel.get_providers_by_type(TextAndEmbeddingProvider) == [provider]
+        assert echo_kernel.get_service(IEmbeddingProvider) is provider
+
+    @pytest.mark.unit
+    def test_constructor_provider_multiple_interfaces(self):
+        """Test that a provider passed to the constructor is indexed under every interface it implements."""
+        class TextAndEmbeddingProvider:
+            async def generate_text(self, prompt, **kwargs):
+                return "text"
+
+            async def generate_embedding(self, text):
+                return [0.1]
+
+        provider = TextAndEmbeddingProvider()
+        kernel = EchoKernel(text_provider=provider)
+
+        assert kernel.get_providers_by_type(ITextProvider) == [provider]
+        assert kernel.get_providers_by_type(IEmbeddingProvider) == [provider]
+        assert kernel.get_service(IEmbeddingProvider) is provider
+
+        kernel.register_provider(provider)
+        assert kernel.embedding_providers == [provider]
+
     @pytest.mark.unit
     def test_get_provider_by_type_empty(self, echo_kernel):
         """Test getting providers by type when none are registered."""
@@ -307,6 +381,27 @@ class TestEchoKernel:
         # Should not add duplicates
         assert len(echo_kernel.text_providers) == initial_count
 
+    @pytest.mark.unit
+    def test_provider_can_be_registered_again_after_clear(self, echo_kernel, mock_text_provider):
+        """Test that clearing providers also forgets which ones were registered."""
+        echo_kernel.register_provider(mock_text_provider)
+        echo_kernel.clear_providers()
+
+        echo_kernel.register_provider(mock_text_provider)
+
+        assert echo_kernel.text_providers == [mock_text_provider]
+
+    @pytest.mark.unit
+    def test_unrecognized_object_does_not_block_later_providers(self, echo_kernel, mock_text_provider):
+        """Test that registering an object implementing no provider interface leaves later providers findable."""
+        echo_kernel.register_provider(object())
+
+        echo_kernel.register_provider(mock_text_provider)
+
+        assert echo_kernel.text_providers == [mock_text_provider]
+        assert echo_kernel.get_service(ITextProvider) is mock_text_provider
+        assert echo_kernel.get_providers_by_type(object) == [mock_text_provider]
+
     @pytest.mark.unit
     def test_tool_registration_duplicates(self, echo_kernel, sample_tool):
         """Test that duplicate tools are handled correctly."""
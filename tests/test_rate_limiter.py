@@ -0,0 +1,110 @@
+"""
+Tests for the token-bucket rate limiter used by the web tools.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from echo_kernel.tools.rate_limiter import HostRateLimiter, TokenBucket
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket."""
+
+    @pytest.mark.unit
+    async def test_burst_up_to_capacity_does_not_wait(self):
+        """Test that a full bucket serves `capacity` requests immediately."""
+        bucket = TokenBucket(capacity=5, rate=1.0)
+
+        start = time.monotonic()
+        for _ in range(5):
+            await bucket.acquire()
+
+        assert time.monotonic() - start < 0.05
+        assert bucket.tokens < 1
+
+    @pytest.mark.unit
+    async def test_empty_bucket_waits_for_refill(self):
+        """Test that an empty bucket waits about 1/rate seconds per request."""
+        bucket = TokenBucket(capacity=1, rate=20.0)
+        await bucket.acquire()
+
+        start = time.monotonic()
+        await bucket.acquire()
+
+        assert time.monotonic() - start >= 0.04
+
+    @pytest.mark.unit
+    async def test_concurrent_waiters_are_paced(self):
+        """Test that concurrent callers share the rate instead of all passing at once."""
+        bucket = TokenBucket(capacity=2, rate=50.0)
+
+        start = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(5)))
+
+        # Two come from the burst; the other three wait ~20ms each
+        assert time.monotonic() - start >= 0.05
+
+    @pytest.mark.unit
+    async def test_drain_forces_the_next_acquire_to_wait(self):
+        """Test that draining gives up the remaining burst allowance."""
+        bucket = TokenBucket(capacity=5, rate=20.0)
+        bucket.drain()
+
+        start = time.monotonic()
+        await bucket.acquire()
+
+        assert time.monotonic() - start >= 0.04
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("capacity, rate", [(0, 1.0), (5, 0)])
+    def test_invalid_configuration(self, capacity, rate):
+        """Test that a bucket that could never hand out a token is rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(capacity=capacity, rate=rate)
+
+
+class TestHostRateLimiter:
+    """Test cases for HostRateLimiter."""
+
+    @pytest.mark.unit
+    def test_buckets_are_per_host(self):
+        """Test that URLs on one host share a bucket and other hosts get their own."""
+        limiter = HostRateLimiter(capacity=1, rate=1.0)
+
+        bucket = limiter.for_url("https://example.com/a")
+
+        assert limiter.for_url("http://EXAMPLE.com:8080/b?q=1") is bucket
+        assert limiter.for_url("https://other.example/a") is not bucket
+        assert limiter.for_url("not a url") is limiter.for_host("default")
+
+    @pytest.mark.unit
+    async def test_hosts_do_not_wait_on_each_other(self):
+        """Test that an exhausted host does not slow requests to another host."""
+        limiter = HostRateLimiter(capacity=1, rate=1.0)
+        await limiter.for_url("https://slow.example/").acquire()
+
+        start = time.monotonic()
+        await limiter.for_url("https://fast.example/").acquire()
+
+        assert time.monotonic() - start < 0.05
+
+    @pytest.mark.unit
+    def test_idle_buckets_are_swept(self, monkeypatch):
+        """Test that buckets unused for idle_timeout seconds are dropped."""
+        now = [1000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        limiter = HostRateLimiter(idle_timeout=600.0)
+        idle = limiter.for_host("idle.example")
+        now[0] += 300.0
+        limiter.for_host("busy.example").drain()
+
+        now[0] += 301.0
+        limiter.for_host("busy.example")
+
+        assert "idle.example" not in limiter._buckets
+        assert "busy.example" in limiter._buckets
+        assert limiter.for_host("idle.example") is not idle
+
@@ -5,60 +5,113 @@ Unit tests for Tool module and EchoTool decorator.
 import pytest
 import asyncio
 from typing import Dict, Any, List
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 import functools
+import inspect
 
-from echo_kernel.Tool import EchoTool, ToolMetadata
+from echo_kernel.Tool import EchoTool, ToolMetadata, _DECORATOR_CACHE_SIZE, _make_decorator
+
+
+def _tool_function(name: str, doc: str = None):
+    """Build a fresh, undecorated function called ``name`` with docstring ``doc``."""
+    def tool(text: str) -> str:
+        return f"{name}: {text}"
+    tool.__name__ = tool.__qualname__ = name
+    tool.__doc__ = doc
+    return tool
 
 
 class TestEchoTool:
     """Test cases for EchoTool decorator."""
 
     @pytest.mark.unit
-    def test_echo_tool_decorator_basic(self):
-        """Test basic EchoTool decorator functionality."""
-        @EchoTool(description="A simple test tool")
-        def test_tool(text: str) -> str:
-            return f"Processed: {text}"
+    @pytest.mark.parametrize("spec, func_name, doc, expected_name, expected_desc, expected_types", [
+        pytest.param({"description": "A simple test tool"}, "test_tool", None,
+                     "test_tool", "A simple test tool", None, id="basic"),
+        pytest.param({"description": "Custom named tool", "name": "custom_tool"}, "some_function", None,
+                     "custom_tool", "Custom named tool", None, id="with_name"),
+        pytest.param({"description": "Tool with parameters", "parameters": {
+                         "text": {"type": "string", "description": "Input text"},
+                         "count": {"type": "integer", "description": "Repeat count", "default": 1},
+                     }}, "repeat_tool", None,
+                     "repeat_tool", "Tool with parameters", {"text": "string", "count": "integer"},
+                     id="with_parameters"),
+        pytest.param({"description": "Complex tool", "parameters": {
+                         "items": {"type": "array", "description": "List of items"},
+                         "config": {"type": "object", "description": "Configuration object"},
+                     }}, "complex_tool", None,
+                     "complex_tool", "Complex tool", {"items": "array", "config": "object"},
+                     id="complex_types"),
+        pytest.param({}, "docstring_tool", "This is a tool with a docstring.",
+                     "docstring_tool", "This is a tool with a docstring.", None, id="without_description"),
+        pytest.param({}, "no_docstring_tool", None,
+                     "no_docstring_tool", "no_docstring_tool", None, id="without_docstring"),
+    ])
+    def test_echo_tool_decoration(self, spec, func_name, doc, expected_name, expected_desc, expected_types):
+        """Test the metadata EchoTool derives from its arguments and the function."""
+        tool = EchoTool(**spec)(_tool_function(func_name, doc))
         
         # Check that the function still works
-        result = test_tool("hello")
-        assert result == "Processed: hello"
+        assert tool("hello") == f"{func_name}: hello"
         
         # Check that metadata was added
-        assert hasattr(test_tool, '_echo_tool_metadata')
-        assert test_tool._echo_tool_metadata.description == "A simple test tool"
-        assert test_tool._echo_tool_metadata.name == "test_tool"
+        metadata = tool._echo_tool_metadata
+        assert metadata is not None
+        assert metadata.name == expected_name
+        assert metadata.description == expected_desc
+        if expected_types is not None:
+            assert {name: info["type"] for name, info in metadata.parameters.items()} == expected_types
 
     @pytest.mark.unit
-    def test_echo_tool_decorator_with_name(self):
-        """Test EchoTool decorator with custom name."""
-        @EchoTool(description="Custom named tool", name="custom_tool")
-        def some_function(text: str) -> str:
-            return f"Custom: {text}"
-        
-        assert some_function._echo_tool_metadata.name == "custom_tool"
-        assert some_function._echo_tool_metadata.description == "Custom named tool"
+    def test_echo_tool_decorator_factory_is_shared(self):
+        """Test that identical decorator specs share one decorator without sharing parameter dicts."""
+        params = {"items": {"type": "array", "default": [1, 2]}}
+        first = EchoTool(description="Shared spec", parameters=params)
+        second = EchoTool(description="Shared spec", parameters={"items": {"type": "array", "default": [1, 2]}})
+        assert first is second
+
+        @first
+        def tool_a(items: list) -> int:
+            return len(items)
+
+        @second
+        def tool_b(items: list) -> int:
+            return len(items)
+
+        assert tool_a._echo_tool_metadata.to_dict()["parameters"] == params
+        assert tool_a._echo_tool_metadata.parameters is not tool_b._echo_tool_metadata.parameters
 
     @pytest.mark.unit
-    def test_echo_tool_decorator_with_parameters(self):
-        """Test EchoTool decorator with parameter information."""
-        @EchoTool(
-            description="Tool with parameters",
-            parameters={
-                "text": {"type": "string", "description": "Input text"},
-                "count": {"type": "integer", "description": "Repeat count", "default": 1}
-            }
-        )
-        def repeat_tool(text: str, count: int = 1) -> str:
-            return text * count
-        
-        metadata = repeat_tool._echo_tool_metadata
-        assert metadata.description == "Tool with parameters"
-        assert "text" in metadata.parameters
-        assert "count" in metadata.parameters
-        assert metadata.parameters["text"]["type"] == "string"
-        assert metadata.parameters["count"]["type"] == "integer"
+    def test_echo_tool_decorator_cache_is_bounded(self):
+        """Test that building many distinct specs does not grow the decorator cache without limit."""
+        for i in range(_DECORATOR_CACHE_SIZE + 10):
+            EchoTool(description=f"Dynamic spec {i}", parameters={"x": {"type": "integer", "maximum": i}})
+
+        assert _make_decorator.cache_info().currsize == _DECORATOR_CACHE_SIZE
+
+    @pytest.mark.unit
+    def test_echo_tool_decorator_keeps_scalar_types_apart(self):
+        """Test that specs differing only in True/1/1.0 are not treated as identical."""
+        schemas = []
+        for default in (1, True, 1.0):
+            @EchoTool(description="Scalar spec", parameters={"flag": {"type": "boolean", "default": default}})
+            def scalar_tool(flag) -> bool:
+                return flag
+            schemas.append(scalar_tool._echo_tool_metadata.parameters["flag"]["default"])
+
+        assert [type(default) for default in schemas] == [int, bool, float]
+
+    @pytest.mark.unit
+    def test_echo_tool_decorator_unhashable_parameters(self):
+        """Test that parameters which cannot be frozen still work, uncached."""
+        params = {"tags": {"type": "array", "default": set()}}
+
+        @EchoTool(description="Unhashable spec", parameters=params)
+        def tagged(tags: list) -> int:
+            return len(tags)
+
+        assert tagged._echo_tool_metadata.parameters == params
+        assert tagged(["a", "b"]) == 2
 
     @pytest.mark.unit
     def test_echo_tool_decorator_async_function(self):
@@ -68,47 +121,9 @@ class TestEchoTool:
             await asyncio.sleep(0.01)  # Simulate async work
             return f"Async: {text}"
         
-        assert hasattr(async_tool, '_echo_tool_metadata')
+        assert async_tool._echo_tool_metadata is not None
         assert async_tool._echo_tool_metadata.description == "Async test tool"
 
-    @pytest.mark.unit
-    def test_echo_tool_decorator_complex_types(self):
-        """Test EchoTool decorator with complex parameter types."""
-        @EchoTool(
-            description="Complex tool",
-            parameters={
-                "items": {"type": "array", "description": "List of items"},
-                "config": {"type": "object", "description": "Configuration object"}
-            }
-        )
-        def complex_tool(items: List[str], config: Dict[str, Any]) -> str:
-            return f"Processed {len(items)} items with config: {config}"
-        
-        metadata = complex_tool._echo_tool_metadata
-        assert metadata.parameters["items"]["type"] == "array"
-        assert metadata.parameters["config"]["type"] == "object"
-
-    @pytest.mark.unit
-    def test_echo_tool_decorator_without_description(self):
-        """Test EchoTool decorator without description (should use docstring)."""
-        @EchoTool()
-        def docstring_tool(text: str) -> str:
-            """This is a tool with a docstring."""
-            return f"Docstring: {text}"
-        
-        metadata = docstring_tool._echo_tool_metadata
-        assert metadata.description == "This is a tool with a docstring."
-
-    @pytest.mark.unit
-    def test_echo_tool_decorator_without_docstring(self):
-        """Test EchoTool decorator without docstring (should use function name)."""
-        @EchoTool()
-        def no_docstring_tool(text: str) -> str:
-            return f"No docstring: {text}"
-        
-        metadata = no_docstring_tool._echo_tool_metadata
-        assert metadata.description == "no_docstring_tool"
-
     @pytest.mark.unit
     def test_echo_tool_decorator_multiple_decorators(self):
         """Test EchoTool decorator with other decorators."""
@@ -124,13 +139,29 @@ class TestEchoTool:
             return f"Original: {text}"
         
         # Check that EchoTool metadata is preserved
-        assert hasattr(multi_decorator_tool, '_echo_tool_metadata')
+        assert multi_decorator_tool._echo_tool_metadata is not None
         assert multi_decorator_tool._echo_tool_metadata.description == "Multiple decorators"
         
         # Check that other decorator still works
         result = multi_decorator_tool("test")
         assert result == "Wrapped: Original: test"
 
+    @pytest.mark.unit
+    def test_echo_tool_wrapper_has_no_instance_dict(self):
+        """Test that the wrapper keeps metadata in slots and reads through to the function."""
+        @EchoTool(description="Slotted tool")
+        def slotted_tool(text: str) -> str:
+            """Slotted docstring."""
+            return text
+
+        assert slotted_tool.__name__ == "slotted_tool"
+        assert slotted_tool.__doc__ == "Slotted docstring."
+        assert slotted_tool.__module__ == __name__
+        assert slotted_tool.__wrapped__("x") == "x"
+        assert inspect.signature(slotted_tool) is slotted_tool.__signature__
+        with pytest.raises(AttributeError):
+            slotted_tool.arbitrary = 1
+
     @pytest.mark.unit
     def test_echo_tool_decorator_class_method(self):
         """Test EchoTool decorator with class method."""
@@ -140,8 +171,9 @@ class TestEchoTool:
                 return f"Class method: {text}"
         
         instance = TestClass()
-        assert hasattr(instance.class_method_tool, '_echo_tool_metadata')
+        assert instance.class_method_tool._echo_tool_metadata is not None
         assert instance.class_method_tool._echo_tool_metadata.description == "Class method tool"
+        assert instance.class_method_tool("hi") == "Class method: hi"
 
     @pytest.mark.unit
     def test_echo_tool_decorator_static_method(self):
@@ -152,7 +184,7 @@ class TestEchoTool:
             def static_method_tool(text: str) -> str:
                 return f"Static method: {text}"
         
-        assert hasattr(TestClass.static_method_tool, '_echo_tool_metadata')
+        assert TestClass.static_method_tool._echo_tool_metadata is not None
         assert TestClass.static_method_tool._echo_tool_metadata.description == "Static method tool"
 
     @pytest.mark.unit
@@ -160,7 +192,7 @@ class TestEchoTool:
         """Test EchoTool decorator with lambda function."""
         lambda_tool = EchoTool(description="Lambda tool")(lambda x: f"Lambda: {x}")
         
-        assert hasattr(lambda_tool, '_echo_tool_metadata')
+        assert lambda_tool._echo_tool_metadata is not None
         assert lambda_tool._echo_tool_metadata.description == "Lambda tool"
         
         result = lambda_tool("test")
@@ -214,9 +246,9 @@ class TestEchoTool:
         derived_instance = DerivedClass()
         
         # Check that both have metadata
-        assert hasattr(base_instance.base_tool, '_echo_tool_metadata')
-        assert hasattr(derived_instance.derived_tool, '_echo_tool_metadata')
-        assert hasattr(derived_instance.base_tool, '_echo_tool_metadata')
+        assert base_instance.base_tool._echo_tool_metadata is not None
+        assert derived_instance.derived_tool._echo_tool_metadata is not None
+        assert derived_instance.base_tool._echo_tool_metadata is not None
 
     @pytest.mark.unit
     def test_echo_tool_decorator_error_handling(self):
@@ -256,6 +288,22 @@ class TestEchoTool:
         # Check docstring
         assert signature_test_tool.__doc__ == "Test function with complex signature."
 
+    @pytest.mark.unit
+    def test_echo_tool_decorator_reuses_wrapper(self):
+        """Test that re-decorating a function with the same arguments skips introspection."""
+        def cached_tool(text: str) -> str:
+            return text
+
+        with patch('echo_kernel.Tool.inspect.signature', wraps=inspect.signature) as signature:
+            first = EchoTool(description="Cached tool")(cached_tool)
+            second = EchoTool(description="Cached tool")(cached_tool)
+            renamed = EchoTool(description="Cached tool", name="renamed")(cached_tool)
+
+        assert second is first
+        assert renamed is not first
+        assert renamed.name == "renamed"
+        assert signature.call_count == 2
+
 
 class TestToolMetadata:
     """Test cases for ToolMetadata class."""
@@ -300,6 +348,40 @@ class TestToolMetadata:
         assert metadata_dict["description"] == "Test tool description"
         assert metadata_dict["parameters"] == {"text": {"type": "string", "description": "Input text"}}
 
+    @pytest.mark.unit
+    def test_tool_metadata_to_dict_is_a_copy(self):
+        """Test that changing a to_dict result does not reach the metadata."""
+        metadata = ToolMetadata.intern("test_tool", "Copied", {"x": {"type": "string", "enum": ["a"]}})
+        
+        payload = metadata.to_dict()
+        payload["parameters"]["x"]["type"] = "integer"
+        payload["parameters"]["x"]["enum"].append("b")
+        payload["parameters"]["y"] = {"type": "string"}
+        
+        assert payload is not metadata.to_dict()
+        assert metadata.to_dict()["parameters"] == {"x": {"type": "string", "enum": ["a"]}}
+        assert ToolMetadata.intern("test_tool", "Copied", {"x": {"type": "string", "enum": ["a"]}}) is metadata
+
+    @pytest.mark.unit
+    def test_tool_metadata_is_read_only(self):
+        """Test that shared metadata cannot be changed through one of the tools using it."""
+        @EchoTool(description="Read-only spec")
+        def same_name(x: int) -> int:
+            return x
+        metadata = same_name._echo_tool_metadata
+        
+        with pytest.raises(AttributeError):
+            metadata.description = "changed"
+        with pytest.raises(AttributeError):
+            del metadata.name
+        
+        @EchoTool(description="Read-only spec")
+        def same_name(x: int) -> int:
+            return x
+        
+        assert same_name._echo_tool_metadata is metadata
+        assert metadata.to_dict()["description"] == "Read-only spec"
+
     @pytest.mark.unit
     def test_tool_metadata_equality(self):
         """Test ToolMetadata equality."""
@@ -310,6 +392,55 @@ class TestToolMetadata:
         assert metadata1 == metadata2
         assert metadata1 != metadata3
 
+    @pytest.mark.unit
+    def test_tool_metadata_parameters_are_read_only(self):
+        """Test that parameters are a read-only copy of the given schema."""
+        params = {"param": {"type": "string"}}
+        metadata = ToolMetadata("test", "description", params)
+        params["other"] = {"type": "integer"}
+        
+        assert "other" not in metadata.parameters
+        with pytest.raises(TypeError):
+            metadata.parameters["other"] = {"type": "integer"}
+        assert type(metadata.to_dict()["parameters"]) is dict
+
+    @pytest.mark.unit
+    def test_tool_metadata_nested_schema_is_not_shared(self):
+        """Test that changing one tool's nested schema leaves interned metadata and other tools alone."""
+        @EchoTool(description="Nested spec")
+        def nested(x: int) -> int:
+            return x
+        first = nested
+
+        @EchoTool(description="Nested spec")
+        def nested(x: int) -> int:
+            return x
+        metadata = nested._echo_tool_metadata
+        assert first._echo_tool_metadata is metadata
+        original = metadata.parameters["properties"]["x"]["type"]
+        
+        first.definition["function"]["parameters"]["properties"]["x"]["type"] = "changed"
+        
+        assert metadata.parameters["properties"]["x"]["type"] == original
+        assert nested.definition["function"]["parameters"]["properties"]["x"]["type"] == original
+        with pytest.raises(TypeError):
+            metadata.parameters["properties"]["x"]["type"] = "string"
+        with pytest.raises(AttributeError):
+            metadata.parameters["required"].append("y")
+
+    @pytest.mark.unit
+    def test_tool_metadata_intern(self):
+        """Test that identical metadata is shared and hashes consistently."""
+        params = {"param": {"type": "string", "enum": ["a", "b"]}}
+        metadata1 = ToolMetadata.intern("test", "description", params)
+        metadata2 = ToolMetadata.intern("test", "description", {"param": {"type": "string", "enum": ["a", "b"]}})
+        metadata3 = ToolMetadata.intern("test", "description", {"param": {"type": "integer"}})
+        
+        assert metadata1 is metadata2
+        assert metadata1 is not metadata3
+        assert hash(metadata1) == hash(ToolMetadata("test", "description", params))
+        assert len({metadata1, metadata2, metadata3}) == 2
+
     @pytest.mark.unit
     def test_tool_metadata_repr(self):
         """Test ToolMetadata string representation."""
@@ -0,0 +1,56 @@
+"""
+Tests for Tool Result Serialization
+
+This module contains tests for how tool return values are turned into the
+content of tool messages sent back to the model.
+"""
+
+import pytest
+
+from echo_kernel._json import loads, tool_content
+from echo_kernel.providers.OpenAITextProvider import OpenAITextProvider
+
+
+class TestToolContent:
+    """Test cases for tool_content."""
+
+    def test_strings_pass_through(self):
+        """Test that a tool returning a string is not serialized again."""
+        assert tool_content('{"already": "json"}') == '{"already": "json"}'
+
+    def test_dicts_become_compact_json(self):
+        """Test that structured results are serialized once, compactly and without escaping."""
+        content = tool_content({"title": "Café", "headings": ["a", "b"], "word_count": 2})
+
+        assert content == '{"title":"Café","headings":["a","b"],"word_count":2}'
+
+    def test_unknown_objects_fall_back_to_str(self):
+        """Test that values JSON cannot represent are written with str()."""
+        class Opaque:
+            def __str__(self):
+                return "opaque"
+
+        assert loads(tool_content({"value": Opaque(), 1: None})) == {"value": "opaque", "1": None}
+
+
+class TestCallTool:
+    """Test cases for how text providers run tool implementations."""
+
+    @pytest.fixture
+    def provider(self):
+        return OpenAITextProvider(api_key="test_key")
+
+    async def test_async_tools_are_awaited(self, provider):
+        """Test that coroutine tools return their result, not a coroutine."""
+        async def lookup(key):
+            return {"key": key}
+
+        result = await provider.call_tool("lookup", '{"key": "k"}', {"lookup": lookup})
+
+        assert result == {"key": "k"}
+
+    async def test_sync_tools_are_called(self, provider):
+        """Test that plain functions still work as tool implementations."""
+        result = await provider.call_tool("add", '{"a": 1, "b": 2}', {"add": lambda a, b: a + b})
+
+        assert result == 3